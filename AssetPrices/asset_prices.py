@@ -1,7 +1,11 @@
 # AssetPrices/asset_prices.py
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from dat5501.instrumentation import instrumented, rows_in, rows_out, stage
+
+@instrumented("asset_prices.fetch_data", rows=rows_out)
 def fetch_data(ticker: str, period: str = "1y", downloader=None) -> pd.DataFrame:
     """
     Download and clean historical price data.
@@ -13,34 +17,95 @@ def fetch_data(ticker: str, period: str = "1y", downloader=None) -> pd.DataFrame
     data = downloader(ticker, period=period)
     return data.dropna()
 
+@instrumented("asset_prices.calculate_daily_percent_change", rows=rows_in)
 def calculate_daily_percent_change(data: pd.DataFrame) -> pd.DataFrame:
     data['Daily % Change'] = data['Close'].pct_change() * 100
     return data
 
+# Not cached: hashing the column costs as much as one pass of std()
+@instrumented("asset_prices.calculate_std_dev", rows=rows_in)
 def calculate_std_dev(data: pd.DataFrame) -> float:
     return round(data['Daily % Change'].std(), 2)
 
-def plot_prices(data: pd.DataFrame, ticker: str):
-    plt.figure(figsize=(10,5))
-    plt.plot(data.index, data['Close'], label='Closing Price')
-    plt.title(f"{ticker} Closing Price (1 Year)")
-    plt.xlabel("Date")
-    plt.ylabel("Price (USD)")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
+def decimate_minmax(x, y, n_buckets: int):
+    """
+    Downsample (x, y) for plotting by keeping the min and max of each of
+    `n_buckets` buckets of equal width in x (plus the first and last point),
+    so spikes survive and each bucket maps to the same horizontal span even
+    across overnight/weekend gaps. x must be ascending (numbers or datetimes).
+    Returns at most 2 * n_buckets + 2 points; shorter series are returned
+    unchanged. NaNs are ignored when picking extremes.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_buckets < 1 or n <= 2 * n_buckets:
+        return x, y
+
+    if getattr(x, "dtype", np.dtype(object)).kind == "M":
+        # Integer ticks straight from pandas: np.asarray on a tz-aware index
+        # (as yfinance returns) would give an object array of Timestamps
+        xv = pd.DatetimeIndex(x).asi8
+    else:
+        xv = np.asarray(x)
+    edges = np.linspace(float(xv[0]), float(xv[-1]), n_buckets + 1)[1:-1]
+    if xv.dtype.kind in "iu":
+        edges = edges.astype(xv.dtype)
+    bounds = np.r_[0, np.searchsorted(xv, edges, side="left"), n]
+    nonempty = bounds[:-1] < bounds[1:]  # gaps leave buckets with no samples
+    starts = bounds[:-1][nonempty]
+    bucket = np.repeat(np.arange(len(starts)), np.diff(bounds)[nonempty])
 
-def plot_percent_change(data: pd.DataFrame, ticker: str):
-    plt.figure(figsize=(10,5))
-    plt.plot(data.index, data['Daily % Change'], label='Daily % Change')
-    plt.title(f"{ticker} Daily Percentage Change (1 Year)")
+    lo = np.where(np.isnan(y), np.inf, y)
+    hi = np.where(np.isnan(y), -np.inf, y)
+
+    def first_match(values, extremes):
+        # first position in each bucket holding that bucket's extreme
+        hits = np.flatnonzero(values == extremes[bucket])
+        return hits[np.unique(bucket[hits], return_index=True)[1]]
+
+    idx_min = first_match(lo, np.minimum.reduceat(lo, starts))
+    idx_max = first_match(hi, np.maximum.reduceat(hi, starts))
+    idx = np.unique(np.concatenate([[0, n - 1], idx_min, idx_max]))  # sorted, so x order is kept
+    return x[idx], y[idx]
+
+
+def _target_buckets(fig) -> int:
+    """One bucket per horizontal pixel of the figure."""
+    return max(1, int(fig.get_figwidth() * fig.dpi))
+
+
+def _plot_series(data: pd.DataFrame, column: str, label: str, title: str, ylabel: str,
+                 save_path=None):
+    """Plot one column against the index, decimated to the figure's pixel width."""
+    fig = plt.figure(figsize=(10,5))
+    x, y = decimate_minmax(data.index, data[column].to_numpy(), _target_buckets(fig))
+    plt.plot(x, y, label=label)
+    plt.title(title)
     plt.xlabel("Date")
-    plt.ylabel("Percentage Change (%)")
+    plt.ylabel(ylabel)
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
+    if save_path is not None:
+        fig.savefig(save_path)
+        plt.close(fig)
+    return fig
+
+def plot_prices(data: pd.DataFrame, ticker: str, save_path=None):
+    """Closing price chart; with `save_path` it is written to file instead of shown."""
+    with stage("asset_prices.plot_prices", rows=len(data)):
+        _plot_series(data, 'Close', 'Closing Price', f"{ticker} Closing Price (1 Year)",
+                     "Price (USD)", save_path)
+    if save_path is None:
+        plt.show()
+
+def plot_percent_change(data: pd.DataFrame, ticker: str, save_path=None):
+    """Daily % change chart; with `save_path` it is written to file instead of shown."""
+    with stage("asset_prices.plot_percent_change", rows=len(data)):
+        _plot_series(data, 'Daily % Change', 'Daily % Change',
+                     f"{ticker} Daily Percentage Change (1 Year)", "Percentage Change (%)", save_path)
+    if save_path is None:
+        plt.show()
 
 if __name__ == "__main__":
     # Import yfinance only when running locally, not during test import
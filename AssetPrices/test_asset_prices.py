@@ -1,10 +1,17 @@
 # AssetPrices/test_asset_prices.py
+import matplotlib
+matplotlib.use("Agg")  # ensure no GUI needed for any plotting code
+
+import numpy as np
 import pandas as pd
 import pytest
 from asset_prices import (
     fetch_data,
     calculate_daily_percent_change,
     calculate_std_dev,
+    decimate_minmax,
+    plot_prices,
+    plot_percent_change,
 )
 
 @pytest.fixture
@@ -40,4 +47,71 @@ def test_calculate_std_dev(fake_hist_df):
     df = calculate_daily_percent_change(fake_hist_df.copy())
     std_dev = calculate_std_dev(df)
     assert isinstance(std_dev, float)
-    assert std_dev > 0
\ No newline at end of file
+    assert std_dev > 0
+
+
+def test_decimate_minmax_keeps_extremes_and_bounds_size():
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=100_000)
+    y[12_345] = 50.0    # isolated spikes must survive
+    y[67_890] = -50.0
+    x = np.arange(len(y))
+    xd, yd = decimate_minmax(x, y, 1_000)
+    assert len(xd) <= 2 * 1_000 + 2
+    assert yd.max() == 50.0 and yd.min() == -50.0
+    assert xd[0] == 0 and xd[-1] == len(y) - 1
+    assert np.all(np.diff(xd) > 0)
+    np.testing.assert_array_equal(y[xd], yd)
+
+
+def test_decimate_minmax_short_series_and_nans():
+    x, y = np.arange(10), np.arange(10.0)
+    xd, yd = decimate_minmax(x, y, 100)
+    np.testing.assert_array_equal(xd, x)
+    y = np.r_[np.nan, np.arange(999.0)]   # pct_change starts with NaN
+    xd, yd = decimate_minmax(np.arange(1_000), y, 10)
+    assert np.nanmax(yd) == 998.0 and np.nanmin(yd) == 0.0
+
+
+def test_decimate_minmax_buckets_are_equal_width_in_x():
+    # Two trading sessions of minute bars separated by a weekend gap
+    idx = pd.date_range("2024-01-05 09:30", periods=390, freq="min").append(
+        pd.date_range("2024-01-08 09:30", periods=390, freq="min"))
+    y = np.random.default_rng(2).normal(size=len(idx))
+    xd, yd = decimate_minmax(idx, y, 100)
+    ticks = xd.asi8
+    edges = np.linspace(idx.asi8[0], idx.asi8[-1], 101)
+    per_bucket = np.histogram(ticks, bins=edges)[0]
+    assert per_bucket.max() <= 3          # min, max (+ an end point)
+    assert per_bucket.sum() == len(xd) <= 2 * 100 + 2
+    # Buckets inside the gap hold no samples, so they add no points
+    occupied = (np.histogram(idx.asi8, bins=edges)[0] > 0).sum()
+    assert occupied < 25 and len(xd) <= 2 * occupied + 2
+    np.testing.assert_array_equal(pd.Series(y, index=idx)[xd].to_numpy(), yd)
+
+
+def test_decimate_minmax_tz_aware_minute_index(tmp_path):
+    # yfinance returns tz-aware indexes
+    idx = pd.date_range("2024-01-02 09:30", periods=5_000, freq="min", tz="America/New_York")
+    y = np.sin(np.arange(len(idx)) / 50.0)
+    for x in (idx, np.asarray(idx.tz_convert(None))):
+        xd, yd = decimate_minmax(x, y, 100)
+        assert len(xd) <= 2 * 100 + 2
+        assert xd[0] == x[0] and xd[-1] == x[-1]
+    assert xd.dtype == idx.tz_convert(None).dtype  # plain datetime64 array in, same out
+    df = calculate_daily_percent_change(pd.DataFrame({"Close": 100 + y}, index=idx))
+    plot_prices(df, "TEST", save_path=tmp_path / "prices.png")
+    assert (tmp_path / "prices.png").stat().st_size > 0
+
+
+def test_plots_save_decimated_file(tmp_path):
+    n = 50_000
+    df = pd.DataFrame(
+        {"Close": 100 + np.cumsum(np.random.default_rng(1).normal(size=n))},
+        index=pd.date_range("2024-01-01", periods=n, freq="min"),
+    )
+    df = calculate_daily_percent_change(df)
+    plot_prices(df, "TEST", save_path=tmp_path / "prices.png")
+    plot_percent_change(df, "TEST", save_path=tmp_path / "pct.png")
+    assert (tmp_path / "prices.png").stat().st_size > 0
+    assert (tmp_path / "pct.png").stat().st_size > 0
@@ -0,0 +1,222 @@
+# ============================================
+#  Benchmark suite for the analysis modules
+#  - Times and memory-profiles each hot function on synthetic data
+#  - Compares against a JSON baseline and fails on regressions
+#
+#  Usage:
+#    python benchmark_suite.py --sizes 1000 100000 --save-baseline
+#    python benchmark_suite.py --sizes 1000 100000            # exit 1 on regression
+# ============================================
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import inspect
+import io
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")  # asset_prices imports pyplot; never open a window
+
+import numpy as np
+import pandas as pd
+
+import synthetic_data as synth
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# -----------------------------
+# Helpers (imported by tests)
+# -----------------------------
+
+def load_activity(folder: str, module: str):
+    """Import a module from one of the activity folders (they are not packages)."""
+    path = str(REPO_ROOT / folder)
+    if path not in sys.path:
+        sys.path.append(path)
+    return importlib.import_module(module)
+
+
+def _print_calendars(print_calendar, args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for days, start in args:
+            print_calendar(days, start)
+
+
+def _warm(func, df, *args):
+    """Call a cached function once so the timed call is a cache hit; returns df."""
+    func(df, *args)
+    return df
+
+
+def benchmark_cases() -> dict:
+    """
+    name -> (setup(n, workdir) -> args, run(args)).
+    Only `run` is timed; setup builds the synthetic input. Functions are
+    unwrapped so result caching and instrumentation don't skew the timings,
+    except in the `*_cache_hit` cases, which time a warm cache lookup.
+    """
+    us_election = load_activity("USelection", "us_election")
+    asset_prices = load_activity("AssetPrices", "asset_prices")
+    duration_from_csv = load_activity("DurationCalculator", "duration_from_csv")
+    model_comparison = load_activity("PolynomialModelComparison", "model_comparison")
+    calendar_printer = load_activity("CalendarPrinter", "calendar_printer")
+
+    return {
+        "compute_state_fraction": (
+            lambda n, workdir: synth.election_rows(n),
+            lambda df: inspect.unwrap(us_election.compute_state_fraction)(df, "Candidate A"),
+        ),
+        "compute_state_fraction_cache_hit": (
+            lambda n, workdir: _warm(us_election.compute_state_fraction, synth.election_rows(n), "Candidate A"),
+            lambda df: us_election.compute_state_fraction(df, "Candidate A"),
+        ),
+        "calculate_daily_percent_change": (
+            lambda n, workdir: synth.price_series(n),
+            lambda df: inspect.unwrap(asset_prices.calculate_daily_percent_change)(df),
+        ),
+        "days_from_csv": (
+            lambda n, workdir: synth.dates_csv(Path(workdir) / f"dates_{n}.csv", n),
+            lambda path: inspect.unwrap(duration_from_csv.days_from_csv)(path),
+        ),
+        "polynomial_sweep": (
+            lambda n, workdir: synth.emissions_panel(n),
+            lambda df: inspect.unwrap(model_comparison.compare_all_entities)(df),
+        ),
+        "print_calendar": (
+            lambda n, workdir: synth.calendar_args(n),
+            lambda args: _print_calendars(calendar_printer.print_calendar, args),
+        ),
+    }
+
+
+def measure(setup, run, n: int, workdir, repeats: int = 3) -> dict:
+    """
+    Best wall time over `repeats` runs, then one separate run under tracemalloc
+    for the peak allocation (tracing slows the code, so it is not timed).
+    Inputs are rebuilt for every run because some functions modify them.
+    """
+    timings = []
+    for _ in range(repeats):
+        args = setup(n, workdir)
+        start = time.perf_counter()
+        run(args)
+        timings.append(time.perf_counter() - start)
+
+    args = setup(n, workdir)
+    tracemalloc.start()
+    try:
+        run(args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"rows": n, "seconds": min(timings), "peak_bytes": peak}
+
+
+def run_suite(sizes, names=None, repeats: int = 3) -> dict:
+    """Run every selected case at every size; keys look like 'name[n]'."""
+    cases = benchmark_cases()
+    unknown = set(names or []) - set(cases)
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {sorted(unknown)}. Available: {sorted(cases)}")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, (setup, run) in cases.items():
+            if names and name not in names:
+                continue
+            for n in sizes:
+                results[f"{name}[{n}]"] = measure(setup, run, n, workdir, repeats=repeats)
+    return results
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+    }
+
+
+def save_baseline(results: dict, path: str | Path) -> None:
+    payload = {"environment": environment(), "results": results}
+    Path(path).write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: str | Path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))["results"]
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float = 0.25,
+                     min_seconds: float = 1e-3) -> list[str]:
+    """
+    Compare results with a baseline. A case regresses when its time or peak
+    memory grows by more than `threshold` (0.25 = 25%). Timing differences
+    below `min_seconds` are treated as noise. Cases missing from either side
+    are skipped.
+    """
+    problems = []
+    for key, new in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        if new["seconds"] > old["seconds"] * (1 + threshold) and new["seconds"] - old["seconds"] > min_seconds:
+            problems.append(f"{key}: time {old['seconds']:.4f}s -> {new['seconds']:.4f}s")
+        if new["peak_bytes"] > old["peak_bytes"] * (1 + threshold):
+            problems.append(f"{key}: peak memory {old['peak_bytes']:,} B -> {new['peak_bytes']:,} B")
+    return problems
+
+
+def format_results(results: dict) -> str:
+    lines = [f"{'benchmark':<44}{'seconds':>12}{'peak MB':>12}"]
+    for key, r in results.items():
+        lines.append(f"{key:<44}{r['seconds']:>12.4f}{r['peak_bytes'] / 1e6:>12.2f}")
+    return "\n".join(lines)
+
+# -----------------------------
+# Script entry point
+# -----------------------------
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the DAT5501 analysis modules.")
+    parser.add_argument("--sizes", nargs="+", type=lambda s: int(float(s)), default=[1_000, 10_000],
+                        help="row counts to run, e.g. 1e3 1e5 1e7")
+    parser.add_argument("--only", nargs="+", help="benchmark names to run (default: all)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown / memory growth before failing (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write these results as the new baseline instead of comparing")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, names=args.only, repeats=args.repeats)
+    print(format_results(results))
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Saved baseline to: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline first.")
+        return 0
+
+    problems = find_regressions(results, load_baseline(args.baseline), threshold=args.threshold)
+    for p in problems:
+        print(f"REGRESSION {p}")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
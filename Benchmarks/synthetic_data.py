@@ -0,0 +1,87 @@
+# ============================================
+#  Seeded synthetic data generators for the benchmark suite
+#  - One generator per analysis module, any row count (10³ … 10⁸)
+#  - Fully vectorised: no per-row Python loops
+# ============================================
+
+from __future__ import annotations
+
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+EMISSIONS_VALUE_COL = "Annual CO₂ emissions (per capita)"
+
+
+def election_rows(n: int, seed: int = 0, n_candidates: int = 5, n_states: int = 50) -> pd.DataFrame:
+    """
+    `n` rows in the US-2016-primary layout: every county has one row per candidate
+    and fraction_votes is the candidate's share of that county's votes.
+    """
+    rng = np.random.default_rng(seed)
+    n_counties = -(-n // n_candidates)  # ceil
+    votes = rng.integers(1, 5_000, size=(n_counties, n_candidates))
+    fractions = votes / votes.sum(axis=1, keepdims=True)
+
+    county = np.repeat(np.arange(n_counties), n_candidates)[:n]
+    state_id = county % n_states
+    states = np.array([f"State{i:02d}" for i in range(n_states)])
+    candidates = np.array([f"Candidate {chr(65 + i)}" for i in range(n_candidates)])
+
+    return pd.DataFrame({
+        "state": pd.Categorical(states[state_id]),
+        "state_abbreviation": pd.Categorical(np.char.add("S", state_id.astype(str))),
+        "county": county,
+        "fips": county + 1_000,
+        "party": "PartyX",
+        "candidate": pd.Categorical(np.tile(candidates, n_counties)[:n]),
+        "votes": votes.ravel()[:n],
+        "fraction_votes": fractions.ravel()[:n],
+    })
+
+
+def price_series(n: int, seed: int = 0, freq: str = "min") -> pd.DataFrame:
+    """`n` bars of a geometric random-walk price, indexed like a yfinance download."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 1e-3, n)))
+    return pd.DataFrame(
+        {"Close": close, "Volume": rng.integers(100, 10_000, n)},
+        index=pd.date_range("2000-01-03", periods=n, freq=freq),
+    )
+
+
+def dates_csv(path: str | Path, n: int, seed: int = 0) -> Path:
+    """Write `n` random YYYY-MM-DD dates (1970–2030) under a `date` header."""
+    rng = np.random.default_rng(seed)
+    days = rng.integers(0, 60 * 365, n).astype("datetime64[D]")
+    path = Path(path)
+    pd.DataFrame({"date": np.datetime_as_string(days, unit="D")}).to_csv(path, index=False)
+    return path
+
+
+def emissions_panel(n: int, seed: int = 0, years_per_entity: int = 100) -> pd.DataFrame:
+    """About `n` rows of the OWID emissions layout: n / years_per_entity entities."""
+    rng = np.random.default_rng(seed)
+    n_entities = max(1, n // years_per_entity)
+    years = np.arange(2023 - years_per_entity, 2023)
+    t = np.linspace(-1, 1, years_per_entity)
+
+    level = rng.uniform(0.5, 15, (n_entities, 1))
+    trend = rng.normal(0, 1, (n_entities, 3))
+    vals = level + trend[:, :1] * t + trend[:, 1:2] * t**2 + trend[:, 2:] * t**3
+    vals = np.abs(vals + rng.normal(0, 0.2, vals.shape))
+
+    entity = np.repeat(np.arange(n_entities), years_per_entity)
+    names = np.char.add("Entity", np.arange(n_entities).astype(str))
+    return pd.DataFrame({
+        "Entity": names[entity],
+        "Code": np.char.add("E", np.arange(n_entities).astype(str))[entity],
+        "Year": np.tile(years, n_entities),
+        EMISSIONS_VALUE_COL: vals.ravel(),
+    })
+
+
+def calendar_args(n: int, seed: int = 0) -> list[tuple[int, int]]:
+    """`n` (days, start) pairs for print_calendar."""
+    rng = np.random.default_rng(seed)
+    return list(zip(rng.integers(28, 32, n).tolist(), rng.integers(0, 7, n).tolist()))
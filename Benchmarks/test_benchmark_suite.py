@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import synthetic_data as synth
+from benchmark_suite import find_regressions, load_activity, load_baseline, run_suite, save_baseline
+
+# ---------- Generators ----------
+
+def test_election_rows_layout_and_fractions():
+    df = synth.election_rows(1_003, seed=1)
+    assert len(df) == 1_003
+    assert list(df.columns) == ["state", "state_abbreviation", "county", "fips",
+                                "party", "candidate", "votes", "fraction_votes"]
+    # Fractions are shares of each county's votes
+    full = df[df["county"] < df["county"].max()]
+    np.testing.assert_allclose(full.groupby("county")["fraction_votes"].sum(), 1.0)
+
+
+def test_generators_are_seeded():
+    pd.testing.assert_frame_equal(synth.price_series(50, seed=3), synth.price_series(50, seed=3))
+    assert not synth.price_series(50, seed=3).equals(synth.price_series(50, seed=4))
+
+
+def test_dates_csv_round_trip(tmp_path: Path):
+    path = synth.dates_csv(tmp_path / "d.csv", 25, seed=2)
+    df = pd.read_csv(path)
+    assert list(df.columns) == ["date"] and len(df) == 25
+    pd.to_datetime(df["date"], format="%Y-%m-%d")  # raises if malformed
+
+
+def test_emissions_panel_rows():
+    df = synth.emissions_panel(1_000, years_per_entity=50)
+    assert len(df) == 1_000
+    assert df["Entity"].nunique() == 20
+
+# ---------- Runner / baselines ----------
+
+def test_run_suite_single_case():
+    results = run_suite([200], names=["compute_state_fraction"], repeats=1)
+    r = results["compute_state_fraction[200]"]
+    assert r["rows"] == 200 and r["seconds"] > 0 and r["peak_bytes"] > 0
+
+
+def test_cache_hit_case_times_only_hits():
+    # The speed-up itself is tracked by the benchmark baseline, not asserted here
+    fraction = load_activity("USelection", "us_election").compute_state_fraction
+    fraction.cache_clear()
+    before = dict(fraction.cache.stats)
+    run_suite([200], names=["compute_state_fraction_cache_hit"], repeats=2)
+    stats = fraction.cache.stats
+    # 3 warm-up calls (2 timed runs + 1 traced run) and 3 measured calls, one computation
+    assert stats["misses"] - before["misses"] == 1
+    assert stats["memory_hits"] - before["memory_hits"] == 5
+
+
+def test_run_suite_unknown_name():
+    with pytest.raises(ValueError):
+        run_suite([10], names=["nope"])
+
+
+def test_find_regressions_threshold(tmp_path: Path):
+    baseline = {
+        "a[10]": {"rows": 10, "seconds": 1.0, "peak_bytes": 1000},
+        "b[10]": {"rows": 10, "seconds": 1.0, "peak_bytes": 1000},
+    }
+    save_baseline(baseline, tmp_path / "baseline.json")
+    assert load_baseline(tmp_path / "baseline.json") == baseline
+
+    results = {
+        "a[10]": {"rows": 10, "seconds": 1.2, "peak_bytes": 1100},   # within 25%
+        "b[10]": {"rows": 10, "seconds": 2.0, "peak_bytes": 5000},   # slower and bigger
+        "c[10]": {"rows": 10, "seconds": 9.0, "peak_bytes": 9000},   # new case: skipped
+    }
+    problems = find_regressions(results, baseline, threshold=0.25)
+    assert len(problems) == 2
+    assert all(p.startswith("b[10]") for p in problems)
+
+
+def test_find_regressions_ignores_tiny_timing_noise():
+    baseline = {"a[10]": {"rows": 10, "seconds": 1e-5, "peak_bytes": 10}}
+    results = {"a[10]": {"rows": 10, "seconds": 5e-5, "peak_bytes": 10}}
+    assert find_regressions(results, baseline) == []
@@ -1,15 +1,53 @@
-def print_calendar(days, start):
+import numpy as np
+
+
+def print_calendar(days, start, non_working=None):
+    """
+    Print a month grid. Days listed in `non_working` are marked with a "*"
+    in place of the trailing space, so column alignment is unchanged.
+    """
+    non_working = set(non_working or ())
     days_list = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
     print(" ".join(days_list))
     print("    " * start, end="")
 
     for d in range(1, days + 1):
-        print(f"{d:>3}", end=" ")
+        print(f"{d:>3}", end="*" if d in non_working else " ")
         if (start + d) % 7 == 0:
             print()
     print()
 
+
+def month_layout(year, month):
+    """(days, start) for a real month, with start as 0=Sun ... 6=Sat."""
+    first = np.datetime64(f"{year:04d}-{month:02d}", "M")
+    days = ((first + 1).astype("datetime64[D]") - first.astype("datetime64[D]")).astype(int)
+    # 1970-01-01 was a Thursday (4 with Sun=0)
+    start = (first.astype("datetime64[D]").astype(int) + 4) % 7
+    return int(days), int(start)
+
+
+def non_working_days(year, month, busdaycal=None):
+    """
+    Day numbers of a month that are not business days under `busdaycal`
+    (an np.busdaycalendar, e.g. from DurationCalculator/business_days.get_calendar).
+    Defaults to weekends only.
+    """
+    days, _ = month_layout(year, month)
+    dates = np.datetime64(f"{year:04d}-{month:02d}-01") + np.arange(days)
+    if busdaycal is None:
+        busdaycal = np.busdaycalendar()
+    working = np.is_busday(dates, busdaycal=busdaycal)
+    return (np.flatnonzero(~working) + 1).tolist()
+
+
+def print_month(year, month, busdaycal=None):
+    """Print a real month with weekends and holidays marked."""
+    days, start = month_layout(year, month)
+    print_calendar(days, start, non_working=non_working_days(year, month, busdaycal))
+
+
 if __name__ == "__main__":
     days = int(input("Days in month: "))
     start = int(input("Start day (0=Sun, 1=Mon, ... 6=Sat): "))
-    print_calendar(days, start)
\ No newline at end of file
+    print_calendar(days, start)
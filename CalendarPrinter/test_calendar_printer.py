@@ -1,10 +1,12 @@
 # test_print_calendar_unittest.py
+import calendar
 import unittest
 from io import StringIO
 from contextlib import redirect_stdout
 
 # ⬇️ Change this import to match your filename (without .py)
-from calendar_printer import print_calendar
+from calendar_printer import print_calendar, month_layout, non_working_days
+import numpy as np
 
 
 def _expected_calendar(days: int, start: int) -> str:
@@ -67,6 +69,26 @@ class TestPrintCalendar(unittest.TestCase):
         out = _run_and_capture(30, 2)
         self.assertTrue(out.endswith("\n"))
 
+    # ---------- Non-working day highlighting ----------
+    def test_non_working_marker_keeps_alignment(self):
+        buf = StringIO()
+        with redirect_stdout(buf):
+            print_calendar(7, 0, non_working=[1, 7])
+        line = buf.getvalue().splitlines()[1]
+        self.assertEqual(line, "  1*  2   3   4   5   6   7*")
+        self.assertEqual(len(line.rstrip("*")), len(_run_and_capture(7, 0).splitlines()[1].rstrip()))
+
+    def test_month_layout_matches_stdlib(self):
+        for year, month in [(2024, 2), (2025, 6), (2025, 12), (2100, 2)]:
+            with self.subTest(year=year, month=month):
+                weekday, days = calendar.monthrange(year, month)  # weekday: 0=Mon
+                self.assertEqual(month_layout(year, month), (days, (weekday + 1) % 7))
+
+    def test_non_working_days_weekends_and_holidays(self):
+        self.assertEqual(non_working_days(2025, 12), [6, 7, 13, 14, 20, 21, 27, 28])
+        cal = np.busdaycalendar(holidays=["2025-12-25", "2025-12-26"])
+        self.assertEqual(non_working_days(2025, 12, cal), [6, 7, 13, 14, 20, 21, 25, 26, 27, 28])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,83 @@
+# business_days.py
+from __future__ import annotations
+
+import datetime as dt
+from functools import lru_cache
+from pathlib import Path
+import sys
+import numpy as np
+import pandas as pd
+
+from dat5501.instrumentation import instrumented, rows_out
+from duration_from_csv import days_from_csv
+
+WEEKDAYS = "1111100"  # Mon-Fri working, Sat/Sun off
+
+def load_holidays(path: str | Path) -> np.ndarray:
+    """
+    Read holiday dates from a CSV with a "date" header (YYYY-MM-DD),
+    the same layout as random_dates_fixed.csv. Extra columns are ignored.
+    """
+    p = Path(path)
+    if not p.exists():
+        raise FileNotFoundError(f"Holiday file not found: {p}")
+    df = pd.read_csv(p)
+    dates = pd.to_datetime(df["date"], format="%Y-%m-%d", errors="raise")
+    return dates.to_numpy(dtype="datetime64[D]")
+
+@lru_cache(maxsize=32)
+def _cached_calendar(weekmask: str, holidays_path: str | None, mtime_ns: int, size: int) -> np.busdaycalendar:
+    holidays = load_holidays(holidays_path) if holidays_path else []
+    return np.busdaycalendar(weekmask=weekmask, holidays=holidays)
+
+def get_calendar(weekmask: str = WEEKDAYS, holidays_path: str | Path | None = None) -> np.busdaycalendar:
+    """
+    Business-day calendar for a weekmask ("1111100" or "Mon Tue Wed Thu Fri")
+    and an optional holiday file. Calendars are cached and reused across calls;
+    editing the holiday file gives a fresh one.
+    """
+    if holidays_path is None:
+        return _cached_calendar(weekmask, None, 0, 0)
+    p = Path(holidays_path).expanduser().resolve()
+    if not p.exists():
+        raise FileNotFoundError(f"Holiday file not found: {p}")
+    st = p.stat()
+    return _cached_calendar(weekmask, str(p), st.st_mtime_ns, st.st_size)
+
+def business_days_between(start, end, calendar: np.busdaycalendar | None = None) -> np.ndarray:
+    """
+    Vectorised count of working days in [start, end) for arrays of dates
+    (negative when end is before start), via np.busday_count.
+    """
+    cal = calendar if calendar is not None else get_calendar()
+    return np.busday_count(
+        np.asarray(start, dtype="datetime64[D]"),
+        np.asarray(end, dtype="datetime64[D]"),
+        busdaycal=cal,
+    )
+
+def business_days_until_today(user_date: str, calendar: np.busdaycalendar | None = None) -> int:
+    """
+    Business-day version of days_until_today: working days from the
+    given date (inclusive) up to today (exclusive). Input format: YYYY-MM-DD
+    """
+    try:
+        input_date = np.datetime64(dt.datetime.strptime(user_date, "%Y-%m-%d").date(), "D")
+    except ValueError:
+        raise ValueError("Invalid date format. Use YYYY-MM-DD.")
+    return int(business_days_between(input_date, np.datetime64("today", "D"), calendar))
+
+@instrumented("business_days.business_days_from_csv", rows=rows_out)
+def business_days_from_csv(csv_path: str | Path, calendar: np.busdaycalendar | None = None) -> pd.DataFrame:
+    """days_from_csv plus a business_days_ago column for every date."""
+    df = days_from_csv(csv_path).copy()
+    df["business_days_ago"] = business_days_between(
+        df["date"].to_numpy(dtype="datetime64[D]"), np.datetime64("today", "D"), calendar
+    )
+    return df
+
+if __name__ == "__main__":
+    csv_arg = Path(sys.argv[1]).expanduser() if len(sys.argv) > 1 else Path("random_dates_fixed.csv")
+    holidays_arg = sys.argv[2] if len(sys.argv) > 2 else None
+    out = business_days_from_csv(csv_arg, get_calendar(holidays_path=holidays_arg))
+    print(out.to_string(index=False))
@@ -1,9 +1,17 @@
 # duration_from_csv.py
+from __future__ import annotations
+
 from pathlib import Path
 import sys
 import numpy as np
 import pandas as pd
 
+from dat5501.instrumentation import instrumented, rows_out
+from dat5501.result_cache import cached
+
+@instrumented("duration_from_csv.days_from_csv", rows=rows_out)
+# Keyed on the file's bytes and today's date, since days_ago changes daily
+@cached(key=lambda csv_path: (Path(csv_path), str(np.datetime64("today", "D"))))
 def days_from_csv(csv_path: str | Path) -> pd.DataFrame:
     p = Path(csv_path)
     if not p.exists():
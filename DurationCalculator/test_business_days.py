@@ -0,0 +1,89 @@
+# test_business_days.py
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from business_days import (
+    business_days_between,
+    business_days_from_csv,
+    business_days_until_today,
+    get_calendar,
+    load_holidays,
+)
+
+class TestBusinessDays(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.holidays = self.dir / "holidays.csv"
+        self.holidays.write_text("date,name\n2025-12-25,Christmas\n2025-12-26,Boxing Day\n", encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_weekdays_only(self):
+        # Mon 2025-12-01 to Mon 2025-12-08: one full working week
+        self.assertEqual(int(business_days_between("2025-12-01", "2025-12-08")), 5)
+
+    def test_holidays_are_skipped(self):
+        cal = get_calendar(holidays_path=self.holidays)
+        self.assertEqual(int(business_days_between("2025-12-22", "2025-12-29", cal)), 3)
+
+    def test_custom_weekmask(self):
+        cal = get_calendar(weekmask="Mon Tue Wed Thu Fri Sat")
+        self.assertEqual(int(business_days_between("2025-12-01", "2025-12-08", cal)), 6)
+
+    def test_reversed_range_is_negative(self):
+        self.assertEqual(int(business_days_between("2025-12-08", "2025-12-01")), -5)
+
+    def test_vectorised_matches_loop(self):
+        cal = get_calendar(holidays_path=self.holidays)
+        rng = np.random.default_rng(0)
+        start = np.datetime64("2025-01-01") + rng.integers(0, 365, 200)
+        end = np.datetime64("2026-01-01")
+        got = business_days_between(start, end, cal)
+        holidays = set(load_holidays(self.holidays).tolist())
+        for s, n in zip(start, got):
+            days = [s + i for i in range((end - s).astype(int))]
+            expected = sum(1 for d in days if d.tolist().weekday() < 5 and d.tolist() not in holidays)
+            self.assertEqual(n, expected)
+
+    def test_calendar_is_cached_until_file_changes(self):
+        first = get_calendar(holidays_path=self.holidays)
+        self.assertIs(get_calendar(holidays_path=self.holidays), first)
+
+        self.holidays.write_text("date\n2025-12-25\n", encoding="utf-8")
+        st = self.holidays.stat()
+        os.utime(self.holidays, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        second = get_calendar(holidays_path=self.holidays)
+        self.assertIsNot(second, first)
+        self.assertEqual(len(second.holidays), 1)
+
+    def test_missing_holiday_file(self):
+        with self.assertRaises(FileNotFoundError):
+            get_calendar(holidays_path=self.dir / "nope.csv")
+
+    def test_until_today(self):
+        today = np.datetime64("today", "D")
+        monday = today - ((today.astype(int) + 3) % 7)  # most recent Monday
+        past = monday - 7
+        self.assertEqual(business_days_until_today(str(past)), 5 + int(np.busday_count(monday, today)))
+        self.assertEqual(business_days_until_today(str(today)), 0)
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            business_days_until_today("20/10/2025")
+
+    def test_from_csv_adds_column(self):
+        csv = self.dir / "dates.csv"
+        csv.write_text("date\n2020-01-01\n2021-06-15\n", encoding="utf-8")
+        out = business_days_from_csv(csv)
+        self.assertEqual(list(out.columns), ["date", "days_ago", "business_days_ago"])
+        self.assertTrue((out["business_days_ago"] < out["days_ago"]).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,13 +6,17 @@ import requests
 import pandas as pd
 import plotly.express as px
 
+from dat5501.instrumentation import stage
+
 OWID_URL = "https://ourworldindata.org/grapher/rule-of-law-index.csv"
 HTML_OUT = "rule_of_law_interactive.html"
 
 # --- Load OWID grapher CSV ---
-r = requests.get(OWID_URL, timeout=60)
-r.raise_for_status()
-df = pd.read_csv(io.StringIO(r.text))
+with stage("rule_of_law.download") as st:
+    r = requests.get(OWID_URL, timeout=60)
+    r.raise_for_status()
+    df = pd.read_csv(io.StringIO(r.text))
+    st.rows = len(df)
 
 # Normalize columns
 df = df.rename(columns={"Entity": "entity", "Code": "code", "Year": "year"})
@@ -42,38 +46,39 @@ owid_blue_scale = [
     [1.00, "#08519c"],
 ]
 
-fig = px.choropleth(
-    df_long,
-    locations="code",
-    color="value",
-    hover_name="entity",
-    animation_frame="year",
-    color_continuous_scale=owid_blue_scale,  # or "Viridis"
-    range_color=color_range,
-    projection="natural earth",
-    title="Rule of Law Index — World Justice Project (via Our World in Data)",
-)
+with stage("rule_of_law.build_figure", rows=len(df_long)):
+    fig = px.choropleth(
+        df_long,
+        locations="code",
+        color="value",
+        hover_name="entity",
+        animation_frame="year",
+        color_continuous_scale=owid_blue_scale,  # or "Viridis"
+        range_color=color_range,
+        projection="natural earth",
+        title="Rule of Law Index — World Justice Project (via Our World in Data)",
+    )
 
-# Layout polish (tight margins, readable colorbar)
-fig.update_layout(
-    margin=dict(l=0, r=0, t=60, b=0),
-    coloraxis_colorbar=dict(
-        title="Index",
-        ticks="outside",
-        tickformat=".2f",
-    ),
-    geo=dict(
-        showcountries=True,
-        showcoastlines=False,
-        showframe=False,
-        bgcolor="rgba(0,0,0,0)",
-    ),
-)
+    # Layout polish (tight margins, readable colorbar)
+    fig.update_layout(
+        margin=dict(l=0, r=0, t=60, b=0),
+        coloraxis_colorbar=dict(
+            title="Index",
+            ticks="outside",
+            tickformat=".2f",
+        ),
+        geo=dict(
+            showcountries=True,
+            showcoastlines=False,
+            showframe=False,
+            bgcolor="rgba(0,0,0,0)",
+        ),
+    )
 
-# Better hover (clean & consistent)
-fig.update_traces(
-    hovertemplate="<b>%{hovertext}</b><br>Code: %{location}<br>Value: %{z:.3f}<extra></extra>"
-)
+    # Better hover (clean & consistent)
+    fig.update_traces(
+        hovertemplate="<b>%{hovertext}</b><br>Code: %{location}<br>Value: %{z:.3f}<extra></extra>"
+    )
 
 # Ensure slider starts on the max available year
 if len(fig.frames) > 0:
@@ -85,6 +90,7 @@ if len(fig.frames) > 0:
         fig.layout.sliders[0].active = start_idx
 
 # Save and show
-fig.write_html(HTML_OUT, include_plotlyjs="cdn", full_html=True)
+with stage("rule_of_law.write_html", rows=len(df_long)):
+    fig.write_html(HTML_OUT, include_plotlyjs="cdn", full_html=True)
 print(f"Saved interactive map to: {HTML_OUT}")
 fig.show()
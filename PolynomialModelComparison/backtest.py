@@ -0,0 +1,122 @@
+# ============================================
+#  Rolling-origin (expanding window) backtest
+#  for the polynomial models in model_comparison.py
+# ============================================
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from model_comparison import pad_panel
+from dat5501.instrumentation import instrumented, rows_in
+
+# -----------------------------
+# Helpers (imported by tests)
+# -----------------------------
+
+def qr_append_row(R: np.ndarray, z: np.ndarray, a: np.ndarray, b: np.ndarray):
+    """
+    Update a batch of least-squares QR factors when one observation is added.
+
+    R is (S, K, K) upper triangular, z = Q^T y is (S, K), and (a, b) is the new
+    design row (S, K) and target (S,). Uses K Givens rotations, i.e. O(K²)
+    per series instead of refitting. A zero row (a=0, b=0) leaves R and z unchanged,
+    which is how padded series simply stop updating.
+    """
+    R, z = R.copy(), z.copy()
+    a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+    for j in range(R.shape[-1]):
+        r = np.hypot(R[:, j, j], a[:, j])
+        safe = np.where(r > 0, r, 1.0)
+        c = np.where(r > 0, R[:, j, j] / safe, 1.0)
+        s = np.where(r > 0, a[:, j] / safe, 0.0)
+
+        Rj = R[:, j, j:].copy()
+        R[:, j, j:] = c[:, None] * Rj + s[:, None] * a[:, j:]
+        a[:, j:] = c[:, None] * a[:, j:] - s[:, None] * Rj
+
+        zj = z[:, j].copy()
+        z[:, j] = c * zj + s * b
+        b = c * b - s * zj
+    return R, z
+
+
+@instrumented("backtest.rolling_origin_backtest", rows=rows_in)
+def rolling_origin_backtest(
+    df: pd.DataFrame,
+    orders=range(1, 10),
+    horizon: int = 10,
+    min_train: int = 30,
+    window: int = 100,
+) -> pd.DataFrame:
+    """
+    Expanding-window backtest of polynomial forecasts for every entity.
+
+    The first fold trains on each series' first `min_train` points; every later
+    fold adds one point and forecasts 1..`horizon` steps ahead. The QR factors are
+    updated with `qr_append_row` as the origin moves, and all entities are
+    processed together, so each fold costs one batched O(K²) update plus a
+    K x K solve per order. As in `compare_all_entities`, one factorisation of the
+    highest-order design serves every order.
+
+    Returns a tidy table with one row per (Entity, order, horizon): n_folds, sse
+    and rmse. Pool across entities with `summarise_backtest`.
+    """
+    orders = list(orders)
+    k_max = max(orders) + 1
+    if min_train < k_max:
+        raise ValueError(f"min_train must be at least {k_max} for order {k_max - 1}")
+
+    # holdout=0: the whole window is used, origins move through it
+    panel = pad_panel(df, window=window, holdout=0)
+    u, y, valid = panel["u"], panel["y"], panel["train"]
+    lengths = valid.sum(axis=1)
+    keep = lengths > min_train  # need at least one point to forecast
+    entities, u, y, valid = panel["entities"][keep], u[keep], y[keep], valid[keep]
+    lengths = lengths[keep]
+
+    n_series, max_len = u.shape if len(entities) else (0, 0)
+    steps = np.arange(1, horizon + 1)
+    sse = np.zeros((n_series, len(orders), horizon))
+    n_folds = np.zeros((n_series, horizon), dtype=int)
+
+    if n_series:
+        A = u[..., None] ** np.arange(k_max) * valid[..., None]  # (S, L, K), padding rows are zero
+        Q, R = np.linalg.qr(A[:, :min_train])
+        z = np.einsum("slk,sl->sk", Q, y[:, :min_train])
+
+        for origin in range(min_train, max_len):
+            # Forecast positions origin, ..., origin + horizon - 1 (0-based)
+            target = origin - 1 + steps
+            in_range = target < max_len
+            idx = np.where(in_range, target, 0)
+            mask = in_range[None, :] & (target[None, :] < lengths[:, None])
+            n_folds += mask
+
+            for i, m in enumerate(orders):
+                k = m + 1
+                coeffs = np.linalg.solve(R[:, :k, :k], z[:, :k, None])[..., 0]
+                pred = np.einsum("shk,sk->sh", A[:, idx, :k], coeffs)
+                sse[:, i] += np.where(mask, (y[:, idx] - pred) ** 2, 0.0)
+
+            # Move the origin forward by one observation
+            R, z = qr_append_row(R, z, A[:, origin], y[:, origin])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rmse = np.sqrt(sse / n_folds[:, None, :])
+
+    grid = pd.MultiIndex.from_product(
+        [entities, orders, steps], names=["Entity", "order", "horizon"]
+    ).to_frame(index=False)
+    grid["n_folds"] = np.broadcast_to(n_folds[:, None, :], sse.shape).ravel()
+    grid["sse"] = sse.ravel()
+    grid["rmse"] = rmse.ravel()
+    return grid
+
+
+def summarise_backtest(results: pd.DataFrame) -> pd.DataFrame:
+    """Pool a backtest table across entities: RMSE per (order, horizon)."""
+    pooled = results.groupby(["order", "horizon"], as_index=False)[["sse", "n_folds"]].sum()
+    pooled["rmse"] = np.sqrt(pooled["sse"] / pooled["n_folds"])
+    return pooled[["order", "horizon", "n_folds", "rmse"]]
@@ -0,0 +1,104 @@
+# ============================================
+#  Cached, typed loader for co-emissions-per-capita.csv
+#  - Parses the CSV once, then reloads a pickled copy
+#  - Entity -> (start, stop) row index for slicing one country
+# ============================================
+
+from __future__ import annotations
+
+from pathlib import Path
+import os
+import pickle
+import tempfile
+import numpy as np
+import pandas as pd
+
+from dat5501.instrumentation import instrumented
+
+VALUE_COL = "Annual CO₂ emissions (per capita)"
+CACHE_VERSION = 1
+
+# -----------------------------
+# Helpers (imported by tests)
+# -----------------------------
+
+def _fingerprint(path: Path) -> tuple[int, int]:
+    """Size and mtime of the source CSV; a change in either invalidates the cache."""
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def parse_emissions_csv(csv_path: str | Path) -> pd.DataFrame:
+    """
+    Read the CSV with compact dtypes and sort it by (Entity, Year).
+    Entity/Code become categoricals and Year an int16.
+    """
+    df = pd.read_csv(
+        csv_path,
+        dtype={"Entity": "category", "Code": "category", "Year": "int16", VALUE_COL: "float64"},
+    )
+    df["Entity"] = df["Entity"].cat.reorder_categories(sorted(df["Entity"].cat.categories))
+    df = df.sort_values(["Entity", "Year"], kind="stable").reset_index(drop=True)
+    return df
+
+
+def build_entity_index(df: pd.DataFrame) -> dict[str, tuple[int, int]]:
+    """Map each entity to its (start, stop) row range in a frame sorted by Entity."""
+    codes = df["Entity"].cat.codes.to_numpy()
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    stops = np.r_[starts[1:], len(codes)]
+    names = df["Entity"].cat.categories[codes[starts]]
+    return {name: (int(a), int(b)) for name, a, b in zip(names, starts, stops)}
+
+
+def _write_cache(cache_path: Path, payload: dict) -> None:
+    """Pickle to a temporary file and rename it, so readers never see a partial cache."""
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except OSError:
+        # The cache is optional (e.g. a read-only data directory); the parsed frame is still returned
+        if tmp is not None:
+            Path(tmp).unlink(missing_ok=True)
+
+
+@instrumented("emissions_data.load_emissions", rows=lambda result, *a, **k: len(result[0]))
+def load_emissions(
+    csv_path: str | Path, cache_path: str | Path | None = None
+) -> tuple[pd.DataFrame, dict[str, tuple[int, int]]]:
+    """
+    Return (frame, entity_index) for the emissions CSV.
+
+    The first call parses the CSV and writes a pickle next to it (or to
+    `cache_path`); later calls load the pickle unless the CSV has changed.
+    """
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV not found: {csv_path}")
+    cache_path = Path(cache_path) if cache_path is not None else csv_path.with_suffix(".pkl")
+    fingerprint = _fingerprint(csv_path)
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("version") == CACHE_VERSION and cached.get("source") == fingerprint:
+                return cached["frame"], cached["index"]
+        except Exception:
+            pass  # unreadable, stale or from another pandas version: rebuild below
+
+    df = parse_emissions_csv(csv_path)
+    index = build_entity_index(df)
+    _write_cache(cache_path, {"version": CACHE_VERSION, "source": fingerprint, "frame": df, "index": index})
+    return df, index
+
+
+def entity_series(df: pd.DataFrame, index: dict[str, tuple[int, int]], entity: str) -> pd.DataFrame:
+    """Rows for one entity as a positional slice of the sorted frame (no boolean mask)."""
+    if entity not in index:
+        raise KeyError(f"Unknown entity: {entity!r}")
+    start, stop = index[entity]
+    return df.iloc[start:stop]
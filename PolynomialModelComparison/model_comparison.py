@@ -1,93 +1,186 @@
+# ============================================
+#  Polynomial Model Comparison on CO₂ per capita
+#  - Exposes helpers for unit tests / reuse
+#  - Runs the UK analysis only when executed as a script
+# ============================================
+
+from __future__ import annotations
+
+from pathlib import Path
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
-# -----------------------------
-# 1. Load data and select UK
-# -----------------------------
-df = pd.read_csv("co-emissions-per-capita.csv")
-
-uk = df[df["Entity"] == "United Kingdom"].copy()
-
-# Last 100 years relative to the latest UK year in the file
-max_year = uk["Year"].max()
-uk_100 = uk[uk["Year"] >= max_year - 100]
-
-years = uk_100["Year"].values
-vals = uk_100["Annual CO₂ emissions (per capita)"].values
-
-# -----------------------------
-# 2. Train / test split
-#    Train: all but last 10 years
-#    Test: last 10 years (for forecast evaluation)
-# -----------------------------
-train_mask = years <= max_year - 10
-test_mask = years > max_year - 10
-
-x_train, y_train = years[train_mask], vals[train_mask]
-x_test, y_test = years[test_mask], vals[test_mask]
-
-# Centre years for numerical stability
-t0 = x_train.mean()
-t_train = x_train - t0
-t_test = x_test - t0
+from dat5501.instrumentation import instrumented, rows_in, stage
+from emissions_data import VALUE_COL, load_emissions
 
 # -----------------------------
-# 3. Fit polynomials of order 1–9
-#    and compute chi2/DOF, BIC, and forecast RMSE
+# Helpers (imported by tests)
 # -----------------------------
-orders = range(1, 10)
-chi2_dof = []
-bics = []
-test_rmse = []
-
-n = len(t_train)
-
-for m in orders:
-    k = m + 1  # number of parameters
-
-    # Fit polynomial of degree m
-    coeffs = np.polyfit(t_train, y_train, deg=m)
-
-    # Predictions on training set
-    yhat_train = np.polyval(coeffs, t_train)
-    rss = np.sum((y_train - yhat_train) ** 2)  # residual sum of squares
-
-    # Chi-squared per degree of freedom
-    chi2_dof.append(rss / (n - k))
-
-    # Bayesian Information Criterion (BIC)
-    bics.append(n * np.log(rss / n) + k * np.log(n))
 
-    # Predictions on test set (last 10 years)
-    yhat_test = np.polyval(coeffs, t_test)
-    test_rmse.append(np.sqrt(np.mean((y_test - yhat_test) ** 2)))
+def pad_panel(df: pd.DataFrame, window: int = 100, holdout: int = 10) -> dict:
+    """
+    Select the last `window` years of every entity and lay the series out as
+    padded (entities x max_len) arrays so all entities can be fitted at once.
+
+    Years are centred on each entity's training mean (as in the original
+    UK script) and scaled to [-1, 1] so high-order design matrices stay
+    well conditioned. Padded cells have both masks set to False.
+    """
+    work = df[["Entity", "Year", VALUE_COL]].dropna()
+    work = work.sort_values(["Entity", "Year"], kind="stable")
+
+    max_year = work.groupby("Entity", observed=True)["Year"].transform("max")
+    keep = work["Year"] >= max_year - window
+    work, max_year = work[keep], max_year[keep]
+
+    train = (work["Year"] <= max_year - holdout).to_numpy()
+    codes, entities = pd.factorize(work["Entity"], sort=True)
+    pos = work.groupby("Entity", observed=True).cumcount().to_numpy()
+
+    years = work["Year"].to_numpy(dtype=float)
+    t0 = pd.Series(np.where(train, years, np.nan)).groupby(codes).transform("mean").to_numpy()
+    t = years - t0
+    scale = pd.Series(np.where(train, np.abs(t), np.nan)).groupby(codes).transform("max").to_numpy()
+    scale = np.where(np.isfinite(scale) & (scale > 0), scale, 1.0)
+
+    n_entities, max_len = len(entities), int(pos.max()) + 1 if len(pos) else 0
+    u = np.zeros((n_entities, max_len))
+    y = np.zeros((n_entities, max_len))
+    train_mask = np.zeros((n_entities, max_len), dtype=bool)
+    test_mask = np.zeros((n_entities, max_len), dtype=bool)
+
+    u[codes, pos] = np.nan_to_num(t / scale)
+    y[codes, pos] = work[VALUE_COL].to_numpy(dtype=float)
+    train_mask[codes, pos] = train
+    test_mask[codes, pos] = ~train
+
+    return {
+        "entities": np.asarray(entities),
+        "u": u,
+        "y": y,
+        "train": train_mask,
+        "test": test_mask,
+    }
+
+
+@instrumented("model_comparison.compare_all_entities", rows=rows_in)
+def compare_all_entities(
+    df: pd.DataFrame,
+    orders=range(1, 10),
+    window: int = 100,
+    holdout: int = 10,
+) -> pd.DataFrame:
+    """
+    Fit polynomials of every order in `orders` to every entity in one batched pass.
+
+    A single stacked QR factorisation of the highest-order design matrix is
+    shared by all orders (the leading k x k block of R is the R factor of the
+    first k columns). Returns a tidy table with one row per (Entity, order):
+    n_train, n_test, chi2_dof, bic and rmse (forecast RMSE on the holdout years).
+    Metrics are NaN when an entity has too few training/test points.
+    """
+    orders = list(orders)
+    panel = pad_panel(df, window=window, holdout=holdout)
+    u, y, train, test = panel["u"], panel["y"], panel["train"], panel["test"]
+    n_entities = len(panel["entities"])
+
+    n_train = train.sum(axis=1)
+    n_test = test.sum(axis=1)
+
+    k_max = max(orders) + 1
+    A = u[..., None] ** np.arange(k_max)          # (E, L, k_max)
+    A_train = A * train[..., None]
+    y_train = y * train
+
+    Q, R = np.linalg.qr(A_train)
+    z = np.einsum("elk,el->ek", Q, y_train)
+
+    frames = []
+    for m in orders:
+        k = m + 1  # number of parameters
+        chi2_dof = np.full(n_entities, np.nan)
+        bic = np.full(n_entities, np.nan)
+        rmse = np.full(n_entities, np.nan)
+
+        ok = n_train > k
+        if k <= R.shape[1] and ok.any():
+            coeffs = np.linalg.solve(R[ok, :k, :k], z[ok, :k, None])[..., 0]
+            yhat = np.einsum("elk,ek->el", A[ok, :, :k], coeffs)
+            sq = (y[ok] - yhat) ** 2
+
+            n = n_train[ok]
+            rss = (sq * train[ok]).sum(axis=1)
+            chi2_dof[ok] = rss / (n - k)
+            with np.errstate(divide="ignore"):
+                bic[ok] = n * np.log(rss / n) + k * np.log(n)
+            with np.errstate(invalid="ignore"):
+                rmse[ok] = np.sqrt((sq * test[ok]).sum(axis=1) / n_test[ok])
+
+        frames.append(pd.DataFrame({
+            "Entity": panel["entities"],
+            "order": m,
+            "n_train": n_train,
+            "n_test": n_test,
+            "chi2_dof": chi2_dof,
+            "bic": bic,
+            "rmse": rmse,
+        }))
+
+    out = pd.concat(frames, ignore_index=True)
+    return out.sort_values(["Entity", "order"], kind="stable").reset_index(drop=True)
 
 # -----------------------------
-# 4. Plots
+# Script-only plotting workflow
 # -----------------------------
 
-# (a) Chi²/DOF and BIC vs polynomial order
-fig, ax = plt.subplots(1, 2, figsize=(12, 5))
-
-ax[0].plot(orders, chi2_dof, marker="o")
-ax[0].set_title("Chi² per DOF vs Polynomial Order")
-ax[0].set_xlabel("Polynomial order")
-ax[0].set_ylabel("Chi²/DOF")
-
-ax[1].plot(orders, bics, marker="o")
-ax[1].set_title("BIC vs Polynomial Order")
-ax[1].set_xlabel("Polynomial order")
-ax[1].set_ylabel("BIC")
-
-plt.tight_layout()
-plt.show()
-
-# (b) Forecast RMSE vs polynomial order
-plt.figure(figsize=(6, 4))
-plt.plot(orders, test_rmse, marker="o")
-plt.title("Forecast RMSE (Last 10 Years) vs Polynomial Order")
-plt.xlabel("Polynomial order")
-plt.ylabel("RMSE")
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+def main() -> None:
+    # Resolve CSV path near this script or CWD
+    csv_name = "co-emissions-per-capita.csv"
+    script_dir = Path(__file__).resolve().parent
+    candidates_paths = [
+        Path.cwd() / csv_name,
+        script_dir / csv_name,
+    ]
+    csv_path = next((p for p in candidates_paths if p.exists()), None)
+    if csv_path is None:
+        raise FileNotFoundError(
+            f"Couldn't find {csv_name}. Tried:\n - {candidates_paths[0]}\n - {candidates_paths[1]}"
+        )
+
+    df, _ = load_emissions(csv_path)
+
+    # Fit orders 1–9 for every entity, then pick out the UK for the plots
+    orders = range(1, 10)
+    results = compare_all_entities(df, orders=orders)
+    uk = results[results["Entity"] == "United Kingdom"]
+
+    # (a) Chi²/DOF and BIC vs polynomial order
+    with stage("model_comparison.plot_metrics", rows=len(uk)):
+        fig, ax = plt.subplots(1, 2, figsize=(12, 5))
+
+        ax[0].plot(uk["order"], uk["chi2_dof"], marker="o")
+        ax[0].set_title("Chi² per DOF vs Polynomial Order")
+        ax[0].set_xlabel("Polynomial order")
+        ax[0].set_ylabel("Chi²/DOF")
+
+        ax[1].plot(uk["order"], uk["bic"], marker="o")
+        ax[1].set_title("BIC vs Polynomial Order")
+        ax[1].set_xlabel("Polynomial order")
+        ax[1].set_ylabel("BIC")
+
+        plt.tight_layout()
+    plt.show()
+
+    # (b) Forecast RMSE vs polynomial order
+    with stage("model_comparison.plot_rmse", rows=len(uk)):
+        plt.figure(figsize=(6, 4))
+        plt.plot(uk["order"], uk["rmse"], marker="o")
+        plt.title("Forecast RMSE (Last 10 Years) vs Polynomial Order")
+        plt.xlabel("Polynomial order")
+        plt.ylabel("RMSE")
+        plt.tight_layout()
+    plt.show()
+
+if __name__ == "__main__":
+    main()
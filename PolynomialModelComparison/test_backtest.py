@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import qr_append_row, rolling_origin_backtest, summarise_backtest
+from model_comparison import VALUE_COL
+
+# ---------- Fixtures ----------
+
+@pytest.fixture
+def panel_df() -> pd.DataFrame:
+    """Two short noisy series of different lengths."""
+    rng = np.random.default_rng(42)
+    rows = []
+    for entity, start, stop in [("Aland", 1980, 2020), ("Bland", 1990, 2021)]:
+        years = np.arange(start, stop + 1)
+        vals = np.sin((years - start) / 8) + rng.normal(0, 0.05, len(years))
+        rows += [(entity, year, val) for year, val in zip(years, vals)]
+    return pd.DataFrame(rows, columns=["Entity", "Year", VALUE_COL])
+
+# ---------- Tests ----------
+
+def test_qr_append_row_matches_full_refit():
+    """Appending rows one at a time should give the same solution as a fresh QR."""
+    rng = np.random.default_rng(0)
+    A = rng.normal(size=(3, 12, 4))
+    y = rng.normal(size=(3, 12))
+
+    Q, R = np.linalg.qr(A[:, :5])
+    z = np.einsum("slk,sl->sk", Q, y[:, :5])
+    for i in range(5, 12):
+        R, z = qr_append_row(R, z, A[:, i], y[:, i])
+
+    coeffs = np.linalg.solve(R, z[..., None])[..., 0]
+    for s in range(3):
+        expected = np.linalg.lstsq(A[s], y[s], rcond=None)[0]
+        np.testing.assert_allclose(coeffs[s], expected, rtol=1e-9, atol=1e-12)
+
+
+def test_backtest_matches_naive_refit(panel_df: pd.DataFrame):
+    """Each (entity, order, horizon) RMSE should equal refitting polyfit at every origin."""
+    min_train, horizon = 10, 3
+    out = rolling_origin_backtest(panel_df, orders=[1, 2], horizon=horizon, min_train=min_train)
+    assert len(out) == 2 * 2 * horizon
+
+    for entity, sub in panel_df.groupby("Entity"):
+        years = sub["Year"].to_numpy(dtype=float)
+        vals = sub[VALUE_COL].to_numpy()
+        t = years - years.mean()
+        for m in [1, 2]:
+            errs = {h: [] for h in range(1, horizon + 1)}
+            for origin in range(min_train, len(years)):
+                coeffs = np.polyfit(t[:origin], vals[:origin], deg=m)
+                for h in errs:
+                    if origin - 1 + h < len(years):
+                        errs[h].append(vals[origin - 1 + h] - np.polyval(coeffs, t[origin - 1 + h]))
+            for h, e in errs.items():
+                row = out[(out["Entity"] == entity) & (out["order"] == m) & (out["horizon"] == h)].iloc[0]
+                assert row["n_folds"] == len(e)
+                assert row["rmse"] == pytest.approx(np.sqrt(np.mean(np.square(e))), rel=1e-6)
+
+
+def test_summarise_backtest_pools_sse(panel_df: pd.DataFrame):
+    out = rolling_origin_backtest(panel_df, orders=[1], horizon=2, min_train=10)
+    pooled = summarise_backtest(out)
+    assert list(pooled.columns) == ["order", "horizon", "n_folds", "rmse"]
+    h1 = out[out["horizon"] == 1]
+    assert pooled.loc[0, "n_folds"] == h1["n_folds"].sum()
+    assert pooled.loc[0, "rmse"] == pytest.approx(np.sqrt(h1["sse"].sum() / h1["n_folds"].sum()))
+
+
+def test_backtest_rejects_too_small_min_train(panel_df: pd.DataFrame):
+    with pytest.raises(ValueError):
+        rolling_origin_backtest(panel_df, orders=[1, 5], min_train=4)
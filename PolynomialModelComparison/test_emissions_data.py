@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import emissions_data
+from emissions_data import VALUE_COL, entity_series, load_emissions
+
+# ---------- Fixtures ----------
+
+@pytest.fixture
+def csv_file(tmp_path: Path) -> Path:
+    """Small unsorted CSV in the OWID layout, including a row with no Code."""
+    csv_text = (
+        f"Entity,Code,Year,{VALUE_COL}\n"
+        "Bland,BLD,2001,2.5\n"
+        "Aland,ALD,2000,1.0\n"
+        "World,,2000,4.0\n"
+        "Bland,BLD,2000,2.0\n"
+        "Aland,ALD,2001,1.5\n"
+    )
+    p = tmp_path / "emissions.csv"
+    p.write_text(csv_text, encoding="utf-8")
+    return p
+
+# ---------- Tests ----------
+
+def test_load_emissions_types_and_index(csv_file: Path):
+    df, index = load_emissions(csv_file)
+    assert isinstance(df["Entity"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["Code"].dtype, pd.CategoricalDtype)
+    assert df["Year"].dtype == np.int16
+    assert index == {"Aland": (0, 2), "Bland": (2, 4), "World": (4, 5)}
+    assert csv_file.with_suffix(".pkl").exists()
+
+
+def test_entity_series_is_sorted_slice(csv_file: Path):
+    df, index = load_emissions(csv_file)
+    bland = entity_series(df, index, "Bland")
+    assert bland["Year"].tolist() == [2000, 2001]
+    assert bland[VALUE_COL].tolist() == [2.0, 2.5]
+    with pytest.raises(KeyError):
+        entity_series(df, index, "Nowhere")
+
+
+def test_cache_is_reused_then_invalidated(csv_file: Path, tmp_path: Path):
+    cache = tmp_path / "cache.pkl"
+    load_emissions(csv_file, cache_path=cache)
+    first_write = cache.stat().st_mtime_ns
+
+    # Unchanged CSV: served from the cache without rewriting it
+    load_emissions(csv_file, cache_path=cache)
+    assert cache.stat().st_mtime_ns == first_write
+
+    # Changed CSV: cache is rebuilt with the new rows
+    with open(csv_file, "a", encoding="utf-8") as f:
+        f.write("Cland,CLD,2000,9.0\n")
+    df, index = load_emissions(csv_file, cache_path=cache)
+    assert "Cland" in index
+    assert entity_series(df, index, "Cland")[VALUE_COL].tolist() == [9.0]
+
+
+def test_load_emissions_missing_file(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        load_emissions(tmp_path / "nope.csv")
+
+
+def test_unloadable_cache_is_rebuilt(csv_file: Path, tmp_path: Path):
+    cache = tmp_path / "cache.pkl"
+    # A pickle that references a module this interpreter doesn't have
+    # (e.g. written by another pandas version) raises ModuleNotFoundError on load
+    cache.write_bytes(b"cno_such_mod\nFoo\n.")
+    df, index = load_emissions(csv_file, cache_path=cache)
+    assert index["Aland"] == (0, 2)
+    df_again, _ = load_emissions(csv_file, cache_path=cache)
+    assert df_again.equals(df)
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+def test_unwritable_cache_location_still_loads(csv_file: Path, tmp_path: Path, monkeypatch):
+    def read_only(*args, **kwargs):
+        raise PermissionError("read-only directory")
+
+    monkeypatch.setattr(emissions_data.tempfile, "mkstemp", read_only)
+    df, index = load_emissions(csv_file, cache_path=tmp_path / "cache.pkl")
+    assert index["Bland"] == (2, 4) and len(df) == 5
+    assert not (tmp_path / "cache.pkl").exists()
@@ -0,0 +1,70 @@
+import matplotlib
+matplotlib.use("Agg")  # ensure no GUI needed for any plotting code
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_comparison import VALUE_COL, compare_all_entities
+
+# ---------- Fixtures ----------
+
+@pytest.fixture
+def panel_df() -> pd.DataFrame:
+    """Three entities with different lengths, start years and shapes."""
+    rng = np.random.default_rng(0)
+    rows = []
+    for entity, start, stop in [("Aland", 1900, 2022), ("Bland", 1950, 2020), ("Cland", 1990, 2021)]:
+        years = np.arange(start, stop + 1)
+        t = (years - years.mean()) / 10
+        vals = 2.0 + 0.3 * t - 0.05 * t**2 + rng.normal(0, 0.1, len(years))
+        rows += [(entity, year, val) for year, val in zip(years, vals)]
+    # Shuffle so the helper can't rely on input order
+    df = pd.DataFrame(rows, columns=["Entity", "Year", VALUE_COL])
+    return df.sample(frac=1, random_state=1).reset_index(drop=True)
+
+
+def _reference(df: pd.DataFrame, entity: str, m: int, window=100, holdout=10):
+    """Original single-country loop using numpy.polyfit."""
+    sub = df[df["Entity"] == entity].sort_values("Year")
+    max_year = sub["Year"].max()
+    sub = sub[sub["Year"] >= max_year - window]
+    years, vals = sub["Year"].to_numpy(), sub[VALUE_COL].to_numpy()
+    tr, te = years <= max_year - holdout, years > max_year - holdout
+    t0 = years[tr].mean()
+    n, k = tr.sum(), m + 1
+    coeffs = np.polyfit(years[tr] - t0, vals[tr], deg=m)
+    rss = np.sum((vals[tr] - np.polyval(coeffs, years[tr] - t0)) ** 2)
+    rmse = np.sqrt(np.mean((vals[te] - np.polyval(coeffs, years[te] - t0)) ** 2))
+    return rss / (n - k), n * np.log(rss / n) + k * np.log(n), rmse
+
+# ---------- Tests ----------
+
+def test_compare_all_entities_matches_polyfit(panel_df: pd.DataFrame):
+    """Batched fits should reproduce the per-entity polyfit metrics."""
+    out = compare_all_entities(panel_df, orders=range(1, 6))
+    assert len(out) == 3 * 5
+    for _, row in out.iterrows():
+        chi2, bic, rmse = _reference(panel_df, row["Entity"], int(row["order"]))
+        assert row["chi2_dof"] == pytest.approx(chi2, rel=1e-6)
+        assert row["bic"] == pytest.approx(bic, rel=1e-6)
+        assert row["rmse"] == pytest.approx(rmse, rel=1e-6)
+
+
+def test_compare_all_entities_tidy_columns(panel_df: pd.DataFrame):
+    out = compare_all_entities(panel_df, orders=[1, 2])
+    assert list(out.columns) == ["Entity", "order", "n_train", "n_test", "chi2_dof", "bic", "rmse"]
+    assert out["Entity"].tolist() == ["Aland", "Aland", "Bland", "Bland", "Cland", "Cland"]
+    # Window keeps 101 years for Aland: 91 train + 10 test
+    aland = out[out["Entity"] == "Aland"].iloc[0]
+    assert (aland["n_train"], aland["n_test"]) == (91, 10)
+
+
+def test_compare_all_entities_short_series_is_nan(panel_df: pd.DataFrame):
+    """Orders with no spare degrees of freedom should give NaN, not crash."""
+    short = pd.DataFrame({"Entity": "Dland", "Year": np.arange(2008, 2022), VALUE_COL: 1.0})
+    out = compare_all_entities(pd.concat([panel_df, short]), orders=[1, 3, 5])
+    dland = out[out["Entity"] == "Dland"].set_index("order")
+    # Dland has 4 training years: order 1 fits, orders 3 and 5 do not
+    assert np.isfinite(dland.loc[1, "chi2_dof"])
+    assert dland.loc[[3, 5], ["chi2_dof", "bic", "rmse"]].isna().all().all()
@@ -10,10 +10,14 @@ from pathlib import Path
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from dat5501.instrumentation import instrumented, rows_in, rows_out, stage
+from dat5501.result_cache import cached
+
 # -----------------------------
 # Helpers (imported by tests)
 # -----------------------------
 
+@instrumented("us_election.load_election_csv", rows=rows_out)
 def load_election_csv(path: str | Path) -> pd.DataFrame:
     """Load the CSV, handling semicolon-separated data."""
     return pd.read_csv(path, sep=';')
@@ -26,6 +30,8 @@ def top_two_candidates(df: pd.DataFrame) -> tuple[str, str]:
     winners = totals.sort_values("votes", ascending=False)["candidate"].tolist()
     return winners[0], winners[1]
 
+@instrumented("us_election.compute_state_fraction", rows=rows_in)
+@cached(columns=["state", "candidate", "votes", "fraction_votes"])
 def compute_state_fraction(df: pd.DataFrame, candidate_name: str) -> pd.Series:
     """
     Weighted state-level vote fraction for a candidate:
@@ -87,24 +93,26 @@ def main() -> None:
     state_frac_top2 = compute_state_fraction(df, top2)
 
     # Plot histogram for top candidate
-    plt.figure(figsize=(9,6))
-    plt.hist(state_frac_top1.dropna(), bins=20, edgecolor="black")
-    plt.title(f"State-level Vote Fraction Distribution: {top1}")
-    plt.xlabel("Vote fraction (0–1)")
-    plt.ylabel("Number of states")
-    plt.grid(axis="y", alpha=0.6)
-    plt.tight_layout()
+    with stage("us_election.plot_histogram", rows=len(state_frac_top1)):
+        plt.figure(figsize=(9,6))
+        plt.hist(state_frac_top1.dropna(), bins=20, edgecolor="black")
+        plt.title(f"State-level Vote Fraction Distribution: {top1}")
+        plt.xlabel("Vote fraction (0–1)")
+        plt.ylabel("Number of states")
+        plt.grid(axis="y", alpha=0.6)
+        plt.tight_layout()
     plt.show()
 
     # Scatter comparison
     comparison = compare_two_candidates(df, top1, top2)
-    plt.figure(figsize=(9,7))
-    plt.scatter(comparison[top1], comparison[top2], alpha=0.7)
-    plt.title(f"State-level Vote Fractions: {top1} vs {top2}")
-    plt.xlabel(f"{top1} fraction")
-    plt.ylabel(f"{top2} fraction")
-    plt.grid(True, linestyle="--", alpha=0.6)
-    plt.tight_layout()
+    with stage("us_election.plot_scatter", rows=len(comparison)):
+        plt.figure(figsize=(9,7))
+        plt.scatter(comparison[top1], comparison[top2], alpha=0.7)
+        plt.title(f"State-level Vote Fractions: {top1} vs {top2}")
+        plt.xlabel(f"{top1} fraction")
+        plt.ylabel(f"{top2} fraction")
+        plt.grid(True, linestyle="--", alpha=0.6)
+        plt.tight_layout()
     plt.show()
 
 if __name__ == "__main__":
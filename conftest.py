@@ -0,0 +1,2 @@
+# Root conftest: pytest puts this directory on sys.path, so every activity's
+# tests can import the shared `dat5501` package without installing it first.
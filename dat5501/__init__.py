@@ -0,0 +1,10 @@
+"""
+Unified command-line entry point for the DAT5501 activities.
+
+    python -m dat5501 --help
+    python -m dat5501 calendar 30 2
+    python -m dat5501 serve          # keep libraries and datasets warm
+
+See dat5501/cli.py for the subcommands and dat5501/server.py for the
+persistent server mode.
+"""
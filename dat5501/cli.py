@@ -0,0 +1,265 @@
+# ============================================
+#  python -m dat5501 <command> ...
+#  - One entry point for every activity script
+#  - Commands are forwarded to a warm `serve` process when one is running
+# ============================================
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+ACTIVITIES = {
+    "us_election": "USelection",
+    "asset_prices": "AssetPrices",
+    "duration_calculator": "DurationCalculator",
+    "duration_from_csv": "DurationCalculator",
+    "business_days": "DurationCalculator",
+    "calendar_printer": "CalendarPrinter",
+    "model_comparison": "PolynomialModelComparison",
+}
+
+# Commands that must run in this process rather than on the server
+LOCAL_ONLY = {"serve", "stop"}
+
+# -----------------------------
+# Helpers
+# -----------------------------
+
+def load_activity(module: str):
+    """Import an activity module by name (the activity folders are not packages)."""
+    path = str(REPO_ROOT / ACTIVITIES[module])
+    if path not in sys.path:
+        sys.path.append(path)
+    return importlib.import_module(module)
+
+
+def warm_up() -> None:
+    """Import every activity module (and with them pandas/matplotlib) up front."""
+    import matplotlib
+    matplotlib.use("Agg")
+    for module in ACTIVITIES:
+        load_activity(module)
+
+
+def _default_path(value: str | None, folder: str, name: str) -> Path:
+    return Path(value).expanduser() if value else REPO_ROOT / folder / name
+
+
+_election_loader = None
+
+
+def _election_frame(csv_path: Path):
+    """Election CSV, memoised on the file's contents so a warm server parses it once."""
+    global _election_loader
+    if _election_loader is None:
+        us_election = load_activity("us_election")
+        from dat5501.result_cache import cached  # imports pandas, so not at client start-up
+        _election_loader = cached(key=lambda p: Path(p))(us_election.load_election_csv)
+    return _election_loader(csv_path)
+
+# -----------------------------
+# Commands
+# -----------------------------
+
+def cmd_us_election(args) -> int:
+    us_election = load_activity("us_election")
+    if args.plot:
+        us_election.main()
+        return 0
+    df = _election_frame(_default_path(args.csv, "USelection", "US-2016-primary (1).csv"))
+    top1, top2 = us_election.top_two_candidates(df)
+    comparison = us_election.compare_two_candidates(df, top1, top2)
+    print(f"Top two candidates: {top1}, {top2}")
+    print(comparison.to_string(float_format="{:.3f}".format))
+    return 0
+
+
+def cmd_asset_prices(args) -> int:
+    asset_prices = load_activity("asset_prices")
+    import yfinance as yf  # only when actually downloading
+
+    df = asset_prices.fetch_data(args.ticker, period=args.period, downloader=yf.download)
+    df = asset_prices.calculate_daily_percent_change(df)
+    std_dev = asset_prices.calculate_std_dev(df)
+    print(f"Standard deviation of daily % changes for {args.ticker}: {std_dev}%")
+    if args.plot:
+        asset_prices.plot_prices(df, args.ticker)
+        asset_prices.plot_percent_change(df, args.ticker)
+    return 0
+
+
+def cmd_duration(args) -> int:
+    duration_calculator = load_activity("duration_calculator")
+    days = duration_calculator.days_until_today(args.date)
+    print(f"{args.date} was {days} days ago.")
+    return 0
+
+
+def _business_calendar(args):
+    """Cached np.busdaycalendar for --weekmask/--holidays."""
+    business_days = load_activity("business_days")
+    return business_days.get_calendar(args.weekmask, args.holidays)
+
+
+def cmd_duration_csv(args) -> int:
+    csv_path = _default_path(args.csv, "DurationCalculator", "random_dates_fixed.csv")
+    if args.business:
+        business_days = load_activity("business_days")
+        out = business_days.business_days_from_csv(csv_path, _business_calendar(args))
+    else:
+        duration_from_csv = load_activity("duration_from_csv")
+        out = duration_from_csv.days_from_csv(csv_path)
+    print(out.to_string(index=False))
+    return 0
+
+
+def cmd_calendar(args) -> int:
+    calendar_printer = load_activity("calendar_printer")
+    calendar_printer.print_calendar(args.days, args.start)
+    return 0
+
+
+def cmd_month(args) -> int:
+    calendar_printer = load_activity("calendar_printer")
+    calendar_printer.print_month(args.year, args.month, _business_calendar(args))
+    return 0
+
+
+def cmd_model_comparison(args) -> int:
+    model_comparison = load_activity("model_comparison")
+    if args.plot:
+        model_comparison.main()
+        return 0
+    from emissions_data import load_emissions
+
+    df, _ = load_emissions(
+        _default_path(args.csv, "PolynomialModelComparison", "co-emissions-per-capita.csv")
+    )
+    results = model_comparison.compare_all_entities(df)
+    if args.entity != "all":
+        results = results[results["Entity"] == args.entity]
+        if results.empty:
+            raise KeyError(f"Unknown entity: {args.entity!r}")
+    print(results.to_string(index=False, float_format="{:.4f}".format))
+    return 0
+
+
+def cmd_serve(args) -> int:
+    from dat5501.server import serve
+    serve(args.socket)
+    return 0
+
+
+def cmd_stop(args) -> int:
+    from dat5501.server import stop_server
+    if stop_server(args.socket):
+        print(f"Stopped server on {args.socket}")
+        return 0
+    print(f"No server running on {args.socket}", file=sys.stderr)
+    return 1
+
+# -----------------------------
+# Parser / dispatch
+# -----------------------------
+
+def _add_calendar_options(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--weekmask", default="1111100",
+                   help="working days, Mon..Sun (default: %(default)s)")
+    p.add_argument("--holidays", help="CSV of holiday dates with a 'date' column")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from dat5501.server import FORWARD_TIMEOUT, REPLY_TIMEOUT, default_socket_path
+
+    parser = argparse.ArgumentParser(prog="python -m dat5501", description="DAT5501 activity tools.")
+    parser.add_argument("--socket", default=default_socket_path(),
+                        help="Unix socket of the warm server (default: %(default)s)")
+    parser.add_argument("--local", action="store_true",
+                        help="run in this process even if a server is running")
+    parser.add_argument("--timeout", type=float, default=FORWARD_TIMEOUT,
+                        help="seconds to wait for the server to accept before running locally (default: %(default)s)")
+    parser.add_argument("--reply-timeout", type=float, default=REPLY_TIMEOUT,
+                        help="seconds to wait for an accepted command before failing (default: %(default)s)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("us-election", help="top-two candidate state fractions")
+    p.add_argument("--csv", help="semicolon-separated primary results CSV")
+    p.add_argument("--plot", action="store_true", help="show the original charts (runs locally)")
+    p.set_defaults(func=cmd_us_election)
+
+    p = sub.add_parser("asset-prices", help="volatility of a ticker (downloads via yfinance)")
+    p.add_argument("ticker", nargs="?", default="NVDA")
+    p.add_argument("--period", default="1y")
+    p.add_argument("--plot", action="store_true", help="show price charts (runs locally)")
+    p.set_defaults(func=cmd_asset_prices)
+
+    p = sub.add_parser("duration", help="days between a YYYY-MM-DD date and today")
+    p.add_argument("date")
+    p.set_defaults(func=cmd_duration)
+
+    p = sub.add_parser("duration-csv", help="days ago for every date in a CSV")
+    p.add_argument("csv", nargs="?", help="CSV with a 'date' column")
+    p.add_argument("--business", action="store_true", help="also count business days ago")
+    _add_calendar_options(p)
+    p.set_defaults(func=cmd_duration_csv)
+
+    p = sub.add_parser("calendar", help="print a month layout")
+    p.add_argument("days", type=int, help="days in the month (28-31)")
+    p.add_argument("start", type=int, help="start day (0=Sun ... 6=Sat)")
+    p.set_defaults(func=cmd_calendar)
+
+    p = sub.add_parser("month", help="print a real month with non-working days marked '*'")
+    p.add_argument("year", type=int)
+    p.add_argument("month", type=int)
+    _add_calendar_options(p)
+    p.set_defaults(func=cmd_month)
+
+    p = sub.add_parser("model-comparison", help="polynomial order metrics per entity")
+    p.add_argument("--csv", help="OWID co-emissions-per-capita CSV")
+    p.add_argument("--entity", default="United Kingdom", help="entity to show, or 'all'")
+    p.add_argument("--plot", action="store_true", help="show the original UK charts (runs locally)")
+    p.set_defaults(func=cmd_model_comparison)
+
+    p = sub.add_parser("serve", help="run the warm server on --socket")
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("stop", help="stop the server on --socket")
+    p.set_defaults(func=cmd_stop)
+    return parser
+
+
+def run(argv) -> int:
+    """Parse and run one command in this process; returns the exit code."""
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as exc:  # --help or a usage error
+        return exc.code if isinstance(exc.code, int) else 1
+    try:
+        return args.func(args) or 0
+    except (FileNotFoundError, ValueError, KeyError, RuntimeError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+
+def main(argv=None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    try:
+        args = build_parser().parse_args(argv)
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else 1
+
+    wants_server = not (args.local or args.command in LOCAL_ONLY or getattr(args, "plot", False))
+    if wants_server:
+        from dat5501.server import forward
+        reply = forward(args.socket, argv, timeout=args.timeout, reply_timeout=args.reply_timeout)
+        if reply is not None:
+            sys.stdout.write(reply["stdout"])
+            sys.stderr.write(reply["stderr"])
+            return reply["exit_code"]
+    return run(argv)
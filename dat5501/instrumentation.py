@@ -0,0 +1,261 @@
+# ============================================
+#  Lightweight per-stage instrumentation
+#  - Wall time, rows processed, rows/sec, peak allocation (tracemalloc)
+#  - Off by default; switch on with DAT5501_INSTRUMENT or `with instrumentation():`
+#  - Export as JSON lines or Prometheus text
+#
+#  DAT5501_INSTRUMENT=1             print a summary to stderr at exit
+#  DAT5501_INSTRUMENT=stages.jsonl  append JSON lines at exit
+#  DAT5501_INSTRUMENT=stages.prom   write Prometheus text at exit
+# ============================================
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+ENV_VAR = "DAT5501_INSTRUMENT"
+_HAS_RESET_PEAK = hasattr(tracemalloc, "reset_peak")  # Python 3.9+
+
+_ACTIVE = None  # the Recorder collecting stages, or None when disabled
+
+
+class _NullStage:
+    """Returned by `stage()` when instrumentation is off; setting rows is a no-op."""
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    def __init__(self, name: str, rows: int | None):
+        self.name = name
+        self.rows = rows
+        self.start_mem = 0
+        self.peak_mem = 0
+        self.peak_known = True
+
+
+class Recorder:
+    """Collects one record per finished stage."""
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.records: list[dict] = []
+        self._open: list[_Stage] = []
+        self._started_tracemalloc = False
+
+    # ---- tracemalloc bookkeeping (nested stages share one global peak)
+    #
+    # Without tracemalloc.reset_peak (Python 3.8) the peak can only be reset
+    # by restarting tracing. That is done before each top-level stage when
+    # this recorder owns tracing; nested stages, or tracing started by someone
+    # else, get peak_bytes=None rather than a process-wide peak.
+
+    def _start_memory(self, st: _Stage) -> None:
+        if not self.trace_memory:
+            return
+        owns_tracing = self._started_tracemalloc or not tracemalloc.is_tracing()
+        if not _HAS_RESET_PEAK and not self._open and owns_tracing:
+            tracemalloc.stop()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        current, peak = tracemalloc.get_traced_memory()
+        for parent in self._open:
+            parent.peak_mem = max(parent.peak_mem, peak)
+        if _HAS_RESET_PEAK:
+            tracemalloc.reset_peak()
+        elif self._open or not owns_tracing:
+            st.peak_known = False
+        st.start_mem = st.peak_mem = current
+
+    def _stop_memory(self, st: _Stage) -> int | None:
+        if not self.trace_memory or not tracemalloc.is_tracing():
+            return None
+        _, peak = tracemalloc.get_traced_memory()
+        for s in self._open:
+            s.peak_mem = max(s.peak_mem, peak)
+        return st.peak_mem - st.start_mem if st.peak_known else None
+
+    @contextmanager
+    def stage(self, name: str, rows: int | None = None):
+        st = _Stage(name, rows)
+        self._start_memory(st)
+        self._open.append(st)
+        start = time.perf_counter()
+        try:
+            yield st
+        finally:
+            seconds = time.perf_counter() - start
+            peak = self._stop_memory(st)
+            self._open.pop()
+            self.records.append({
+                "stage": name,
+                "timestamp": time.time(),
+                "seconds": seconds,
+                "rows": st.rows,
+                "rows_per_sec": st.rows / seconds if st.rows is not None and seconds > 0 else None,
+                "peak_bytes": peak,
+            })
+
+    def close(self) -> None:
+        if self._started_tracemalloc and not self._open:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    # ---- exporters
+
+    def summary(self) -> dict:
+        """Aggregate records per stage: calls, total seconds/rows, max peak."""
+        out: dict[str, dict] = {}
+        for r in self.records:
+            agg = out.setdefault(r["stage"], {"calls": 0, "seconds": 0.0, "rows": 0, "peak_bytes": 0})
+            agg["calls"] += 1
+            agg["seconds"] += r["seconds"]
+            agg["rows"] += r["rows"] or 0
+            agg["peak_bytes"] = max(agg["peak_bytes"], r["peak_bytes"] or 0)
+        return out
+
+    def write_jsonl(self, path: str | Path) -> None:
+        """Append one JSON object per record."""
+        with open(path, "a", encoding="utf-8") as f:
+            for r in self.records:
+                f.write(json.dumps(r) + "\n")
+
+    def to_prometheus(self) -> str:
+        """Per-stage totals in the Prometheus text exposition format."""
+        metrics = [
+            ("dat5501_stage_calls_total", "counter", "Number of times the stage ran", "calls"),
+            ("dat5501_stage_seconds_total", "counter", "Wall time spent in the stage", "seconds"),
+            ("dat5501_stage_rows_total", "counter", "Rows processed by the stage", "rows"),
+            ("dat5501_stage_peak_bytes", "gauge", "Largest peak allocation of one call", "peak_bytes"),
+        ]
+        summary = self.summary()
+        lines = []
+        for metric, kind, help_text, key in metrics:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, agg in summary.items():
+                label = name.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{metric}{{stage="{label}"}} {agg[key]}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | Path) -> None:
+        Path(path).write_text(self.to_prometheus(), encoding="utf-8")
+
+    def format_summary(self) -> str:
+        lines = [f"{'stage':<40}{'calls':>6}{'seconds':>10}{'rows':>12}{'rows/s':>14}{'peak MB':>10}"]
+        for name, agg in self.summary().items():
+            rate = agg["rows"] / agg["seconds"] if agg["seconds"] > 0 else 0.0
+            lines.append(
+                f"{name:<40}{agg['calls']:>6}{agg['seconds']:>10.4f}{agg['rows']:>12}"
+                f"{rate:>14.0f}{agg['peak_bytes'] / 1e6:>10.2f}"
+            )
+        return "\n".join(lines)
+
+# -----------------------------
+# Public hooks used by the activity modules
+# -----------------------------
+
+def enabled() -> bool:
+    return _ACTIVE is not None
+
+
+def stage(name: str, rows: int | None = None):
+    """
+    Context manager around one stage. Set `.rows` on the yielded object if
+    the row count is only known at the end. Near-free when disabled.
+    """
+    if _ACTIVE is None:
+        return _NULL_STAGE
+    return _ACTIVE.stage(name, rows)
+
+
+def rows_in(result, *args, **kwargs) -> int:
+    """Row count of the first argument (e.g. the input DataFrame)."""
+    return len(args[0])
+
+
+def rows_out(result, *args, **kwargs) -> int:
+    """Row count of the returned object."""
+    return len(result)
+
+
+def instrumented(name: str, rows=None):
+    """
+    Decorator form of `stage()`. `rows(result, *args, **kwargs)` gives the
+    row count, e.g. `rows_in` or `rows_out`. When disabled the wrapper just
+    calls the function.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _ACTIVE is None:
+                return func(*args, **kwargs)
+            with _ACTIVE.stage(name) as st:
+                result = func(*args, **kwargs)
+                if rows is not None:
+                    st.rows = rows(result, *args, **kwargs)
+                return result
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def instrumentation(trace_memory: bool = True):
+    """Enable instrumentation inside the block and yield the Recorder."""
+    global _ACTIVE
+    previous, recorder = _ACTIVE, Recorder(trace_memory=trace_memory)
+    _ACTIVE = recorder
+    try:
+        yield recorder
+    finally:
+        _ACTIVE = previous
+        recorder.close()
+
+
+def export(recorder: Recorder, target: str) -> None:
+    """Write a recorder to `target`: '1' -> stderr, *.prom -> Prometheus, else JSON lines."""
+    if target.lower() in {"1", "true", "yes", "on", "stderr"}:
+        print(recorder.format_summary(), file=sys.stderr)
+    elif target.endswith(".prom"):
+        recorder.write_prometheus(target)
+    else:
+        recorder.write_jsonl(target)
+
+
+def target_from_env(environ=os.environ) -> str | None:
+    """The export target named by ENV_VAR, or None if it is unset or switched off."""
+    target = environ.get(ENV_VAR, "").strip()
+    if not target or target.lower() in {"0", "false", "no", "off"}:
+        return None
+    return target
+
+
+def configure_from_env(environ=os.environ) -> Recorder | None:
+    """Switch instrumentation on for the whole process if ENV_VAR is set."""
+    global _ACTIVE
+    target = target_from_env(environ)
+    if target is None or _ACTIVE is not None:
+        return None
+    _ACTIVE = Recorder()
+    atexit.register(export, _ACTIVE, target)
+    return _ACTIVE
+
+
+configure_from_env()
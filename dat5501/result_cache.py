@@ -0,0 +1,285 @@
+# ============================================
+#  Content-addressed result cache for analysis helpers
+#  - Key = function name + fast hash of the arguments' contents
+#    (DataFrame/Series values, arrays, file bytes, plain values)
+#  - Numeric and categorical columns are hashed as raw buffers with
+#    SHA-256 (hardware-accelerated on current CPUs); `columns=` restricts
+#    DataFrame arguments to the columns a function actually reads
+#  - In-memory LRU tier, optional on-disk tier, both size-bounded
+#  - Hit/miss statistics and explicit invalidation
+#
+#  DAT5501_CACHE_DIR=/path/to/dir  enables the on-disk tier for the default cache
+# ============================================
+
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR_ENV_VAR = "DAT5501_CACHE_DIR"
+
+# -----------------------------
+# Hashing
+# -----------------------------
+
+def _update_column(h, s: pd.Series) -> None:
+    """Feed one column's values (not its index) into `h` as cheaply as its dtype allows."""
+    h.update(repr((str(s.name), str(s.dtype))).encode())
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        h.update(pd.util.hash_pandas_object(s.cat.categories, index=False).to_numpy())
+        h.update(np.ascontiguousarray(s.cat.codes.to_numpy()))
+    elif isinstance(s.dtype, np.dtype) and s.dtype.kind in "biufcmM":
+        h.update(np.ascontiguousarray(s.to_numpy()).view(np.uint8))
+    else:  # object / extension dtypes: pandas' vectorised value hash
+        h.update(pd.util.hash_pandas_object(s, index=False).to_numpy())
+
+
+def _update_index(h, index: pd.Index) -> None:
+    if isinstance(index, pd.RangeIndex):
+        h.update(repr(("range", index.start, index.stop, index.step, index.name)).encode())
+    else:
+        _update_column(h, index.to_series(index=pd.RangeIndex(len(index))))
+
+
+def _update_hash(h, value, columns=None) -> None:
+    """
+    Feed a type tag plus the contents of `value` into hasher `h`. With
+    `columns`, DataFrames contribute only those columns' values (no index).
+    """
+    if isinstance(value, pd.DataFrame):
+        h.update(b"df")
+        if columns is None:
+            h.update(repr([str(c) for c in value.columns]).encode())
+            _update_index(h, value.index)
+            selected = value.columns
+        else:
+            selected = [c for c in columns if c in value.columns]
+            h.update(repr([str(c) for c in selected]).encode())
+        for c in selected:
+            _update_column(h, value[c])
+    elif isinstance(value, pd.Series):
+        h.update(b"series")
+        _update_index(h, value.index)
+        _update_column(h, value)
+    elif isinstance(value, np.ndarray):
+        h.update(b"ndarray")
+        h.update(repr((value.dtype.str, value.shape)).encode())
+        if value.dtype.hasobject:
+            h.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        else:
+            h.update(np.ascontiguousarray(value).view(np.uint8))
+    elif isinstance(value, Path):
+        # Content-addressed: the same bytes under another name share an entry
+        h.update(b"path")
+        if value.is_file():
+            with open(value, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+        else:
+            h.update(str(value).encode())
+    elif isinstance(value, (list, tuple)):
+        h.update(type(value).__name__.encode())
+        for item in value:
+            _update_hash(h, item, columns)
+    elif isinstance(value, dict):
+        h.update(b"dict")
+        for k in sorted(value, key=repr):
+            _update_hash(h, k, columns)
+            _update_hash(h, value[k], columns)
+    elif value is None or isinstance(value, (str, bytes, int, float, bool)):
+        h.update(repr(value).encode())
+    else:
+        h.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def make_key(namespace: str, args=(), kwargs=None, extra=None, columns=None) -> str:
+    """Cache key: '<namespace>-<SHA-256 of the arguments, 32 hex digits>'."""
+    h = hashlib.sha256()
+    _update_hash(h, (args, kwargs or {}, extra), columns)
+    return f"{namespace}-{h.hexdigest()[:32]}"
+
+
+def _size_of(value) -> int:
+    """Approximate in-memory size used for the LRU budget."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True, index=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+# -----------------------------
+# Cache
+# -----------------------------
+
+class ResultCache:
+    """
+    Two-tier LRU cache. The memory tier holds at most `max_bytes`; the disk
+    tier (if `cache_dir` is set) holds at most `max_disk_bytes` of pickles,
+    evicting the least recently used files. Values are copied on the way in
+    and out so callers can't modify cached results.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20, cache_dir: str | Path | None = None,
+                 max_disk_bytes: int = 2**30):
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory: OrderedDict[str, tuple[object, int]] = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    # ---- memory tier
+
+    def _memory_put(self, key: str, value, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key)[1]
+        self._memory[key] = (value, size)
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_bytes:
+            _, (_, old_size) = self._memory.popitem(last=False)
+            self._memory_bytes -= old_size
+            self.stats["evictions"] += 1
+
+    # ---- disk tier
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def _disk_get(self, key: str):
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except Exception:
+            # Corrupt, or written by another pandas/numpy version (ModuleNotFoundError,
+            # TypeError, ...): a miss, and the file is dropped so it is rewritten
+            path.unlink(missing_ok=True)
+            return False, None
+        os.utime(path)  # mark as recently used
+        return True, value
+
+    def _disk_put(self, key: str, value) -> None:
+        path = self._disk_path(key)
+        tmp = path.with_suffix(".tmp")
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            tmp.unlink(missing_ok=True)
+            return
+        self._disk_evict()
+
+    def _disk_evict(self) -> None:
+        files = [(p.stat().st_mtime_ns, p.stat().st_size, p) for p in self.cache_dir.glob("*.pkl")]
+        total = sum(size for _, size, _ in files)
+        for _, size, p in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+            self.stats["evictions"] += 1
+
+    # ---- public API
+
+    def get(self, key: str):
+        """Return (hit, value)."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return True, copy.deepcopy(self._memory[key][0])
+            if self.cache_dir is not None:
+                hit, value = self._disk_get(key)
+                if hit:
+                    self.stats["disk_hits"] += 1
+                    self._memory_put(key, value, _size_of(value))
+                    return True, copy.deepcopy(value)
+            self.stats["misses"] += 1
+            return False, None
+
+    def put(self, key: str, value) -> None:
+        stored = copy.deepcopy(value)
+        with self._lock:
+            self._memory_put(key, stored, _size_of(stored))
+            if self.cache_dir is not None:
+                self._disk_put(key, stored)
+
+    def invalidate(self, prefix: str = "") -> int:
+        """Drop every entry whose key starts with `prefix` (all entries by default)."""
+        removed = 0
+        with self._lock:
+            for key in [k for k in self._memory if k.startswith(prefix)]:
+                self._memory_bytes -= self._memory.pop(key)[1]
+                removed += 1
+            if self.cache_dir is not None:
+                for p in self.cache_dir.glob(f"{prefix}*.pkl"):
+                    p.unlink(missing_ok=True)
+                    removed += 1
+        return removed
+
+    def hit_rate(self) -> float:
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        total = hits + self.stats["misses"]
+        return hits / total if total else 0.0
+
+
+default_cache = ResultCache(cache_dir=os.environ.get(CACHE_DIR_ENV_VAR) or None)
+
+
+def cached(cache: ResultCache | None = None, key_extra=None, columns=None, key=None):
+    """
+    Memoise a function on the contents of its arguments.
+
+    `key_extra(*args, **kwargs)` is mixed into the key on every call, for
+    results that depend on more than the argument values (today's date, a
+    version tag, ...). `key(*args, **kwargs)`, if given, is hashed instead
+    of the arguments, e.g. `lambda path: Path(path)` to hash a CSV's bytes
+    once however the path is passed. `columns` limits DataFrame
+    arguments to the listed columns' values, for functions that read only
+    those columns and not the index; a hit then hashes just that data.
+    The wrapper gets `.cache` and `.cache_clear()`.
+    """
+    store = cache if cache is not None else default_cache
+
+    def decorator(func):
+        namespace = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            extra = key_extra(*args, **kwargs) if key_extra is not None else None
+            if key is not None:
+                cache_key = make_key(namespace, (key(*args, **kwargs),), None, extra, columns)
+            else:
+                cache_key = make_key(namespace, args, kwargs, extra, columns)
+            hit, value = store.get(cache_key)
+            if hit:
+                return value
+            value = func(*args, **kwargs)
+            store.put(cache_key, value)
+            return value
+
+        wrapper.cache = store
+        wrapper.cache_clear = lambda: store.invalidate(namespace + "-")
+        return wrapper
+    return decorator
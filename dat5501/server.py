@@ -0,0 +1,222 @@
+# ============================================
+#  Warm server for `python -m dat5501`
+#  - Listens on a Unix socket and runs CLI commands in one long-lived
+#    process, so pandas/matplotlib and cached datasets stay loaded
+#  - Protocol: one JSON line per message
+#      request: {"argv": [...], "cwd": "...", "env": {...}}
+#      accept:  {"accepted": true}  (sent before the command starts)
+#      reply:   {"exit_code": 0, "stdout": "...", "stderr": "..."}
+#  - Requests are handled one at a time (commands print to stdout)
+#  - The socket is created 0600 and clients only talk to a socket owned
+#    by their own uid
+#  - A server that doesn't accept within the timeout is skipped and the
+#    command runs locally; the server drops requests whose client has
+#    gone. Once accepted, a command never runs twice: a late reply is
+#    reported as an error
+#  - The client's DAT5501_INSTRUMENT and DAT5501_CACHE_DIR are sent with
+#    each request and apply to that command on the server
+# ============================================
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+from pathlib import Path
+
+SOCKET_ENV_VAR = "DAT5501_SOCKET"
+FORWARDED_ENV_VARS = ("DAT5501_INSTRUMENT", "DAT5501_CACHE_DIR")  # applied per command
+FORWARD_TIMEOUT = 60.0  # seconds to wait for the server to accept before running locally
+REPLY_TIMEOUT = 3600.0  # seconds to wait for an accepted command to finish
+READ_TIMEOUT = 10.0  # seconds the server waits for a connected client's request
+
+
+def default_socket_path() -> str:
+    """$DAT5501_SOCKET, else the per-user $XDG_RUNTIME_DIR, else the temp dir."""
+    if os.environ.get(SOCKET_ENV_VAR):
+        return os.environ[SOCKET_ENV_VAR]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return str(Path(os.environ["XDG_RUNTIME_DIR"]) / "dat5501.sock")
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return str(Path(tempfile.gettempdir()) / f"dat5501-{uid}.sock")
+
+
+def _is_own_socket(socket_path: str) -> bool:
+    """True only for a socket (not a symlink) owned by the current user."""
+    try:
+        st = os.lstat(socket_path)
+    except FileNotFoundError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+# -----------------------------
+# Client side
+# -----------------------------
+
+def _no_reply(socket_path: str, reply_timeout: float | None) -> dict:
+    message = (f"error: the server on {socket_path} accepted the command but did not reply "
+               f"within {reply_timeout} s; it may still be running it (use --local to run here)\n")
+    return {"exit_code": 1, "stdout": "", "stderr": message}
+
+
+def _request(socket_path: str, payload: dict, timeout: float,
+             reply_timeout: float | None = REPLY_TIMEOUT) -> dict | None:
+    """
+    Send one request; None if no server of ours is listening on `socket_path`
+    or it doesn't accept the request within `timeout` seconds. Once the
+    server has accepted, waits up to `reply_timeout` seconds and reports a
+    missing reply as an error rather than None, so the caller never runs a
+    command the server is still running.
+    """
+    if not hasattr(socket, "AF_UNIX") or not _is_own_socket(socket_path):
+        return None  # missing, or planted by another user: never send it our argv
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+                reply = json.loads(line) if line else None
+                if not (isinstance(reply, dict) and reply.get("accepted")):
+                    return reply
+                sock.settimeout(reply_timeout)
+                try:
+                    return json.loads(f.readline())
+                except (OSError, ValueError):
+                    return _no_reply(socket_path, reply_timeout)
+    except (OSError, ValueError):
+        return None  # stale socket file, busy or wedged server, or a garbled reply
+
+
+def forward(socket_path: str, argv: list[str], timeout: float = FORWARD_TIMEOUT,
+            reply_timeout: float | None = REPLY_TIMEOUT) -> dict | None:
+    """Run `argv` on the server, or return None so the caller runs it locally."""
+    env = {name: os.environ[name] for name in FORWARDED_ENV_VARS if os.environ.get(name)}
+    payload = {"argv": argv, "cwd": os.getcwd(), "env": env}
+    return _request(socket_path, payload, timeout, reply_timeout)
+
+
+def stop_server(socket_path: str) -> bool:
+    return _request(socket_path, {"stop": True}, timeout=10) is not None
+
+# -----------------------------
+# Server side
+# -----------------------------
+
+@contextlib.contextmanager
+def _cache_dir(path: str):
+    """Point the default cache's disk tier at `path` for one command."""
+    from dat5501.result_cache import default_cache as cache
+
+    previous, cache_dir = cache.cache_dir, Path(path).resolve()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache.cache_dir = cache_dir
+    try:
+        yield
+    finally:
+        cache.cache_dir = previous
+
+
+def _run_with_env(run, argv: list[str], env: dict) -> int:
+    """Run one command under the client's DAT5501_* settings."""
+    from dat5501.instrumentation import export, instrumentation, target_from_env
+    from dat5501.result_cache import CACHE_DIR_ENV_VAR
+
+    with contextlib.ExitStack() as stack:
+        if env.get(CACHE_DIR_ENV_VAR):
+            stack.enter_context(_cache_dir(env[CACHE_DIR_ENV_VAR]))
+        target = target_from_env(env)
+        if target is None:
+            return run(argv)
+        with instrumentation() as recorder:
+            code = run(argv)
+        export(recorder, target)  # per command, not at server exit
+        return code
+
+
+def execute(argv: list[str], cwd: str | None = None, env: dict | None = None) -> dict:
+    """Run one CLI command in this process, capturing its output."""
+    from dat5501.cli import run
+
+    out, err = io.StringIO(), io.StringIO()
+    previous = os.getcwd()
+    try:
+        if cwd:
+            os.chdir(cwd)  # so relative paths resolve as they would for the client
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                code = _run_with_env(run, argv, env or {})
+            except Exception as exc:  # keep the server alive whatever a command does
+                print(f"error: {type(exc).__name__}: {exc}", file=err)
+                code = 1
+    finally:
+        os.chdir(previous)
+    return {"exit_code": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    timeout = READ_TIMEOUT  # an idle client must not block the one-at-a-time server
+
+    def handle(self):
+        try:
+            line = self.rfile.readline()
+        except OSError:
+            return  # timed out waiting for the request
+        if not line:
+            return
+        request = json.loads(line)
+        if request.get("stop"):
+            reply = {"exit_code": 0, "stdout": "", "stderr": ""}
+            # shutdown() blocks until serve_forever returns, so call it from another thread
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        else:
+            try:
+                self.wfile.write(b'{"accepted": true}\n')
+            except OSError:
+                return  # the client gave up while we were busy and will run it locally
+            reply = execute(request.get("argv", []), request.get("cwd"), request.get("env"))
+        with contextlib.suppress(OSError):  # the client may have stopped waiting
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+def make_server(socket_path: str) -> socketserver.UnixStreamServer:
+    """
+    Bind the server with a 0600 socket, replacing a stale socket file of
+    ours but never a live server or another user's file.
+    """
+    if os.path.lexists(socket_path):
+        if not _is_own_socket(socket_path):
+            raise RuntimeError(f"{socket_path} exists and is not a socket owned by this user")
+        if _request(socket_path, {"argv": ["--help"]}, timeout=5) is not None:
+            raise RuntimeError(f"A server is already running on {socket_path}")
+        os.unlink(socket_path)
+    old_umask = os.umask(0o177)  # no window where the socket is group/world accessible
+    try:
+        return socketserver.UnixStreamServer(socket_path, _Handler)
+    finally:
+        os.umask(old_umask)
+
+
+def serve(socket_path: str | None = None) -> None:
+    """Warm up the activity modules and serve requests until `stop`."""
+    from dat5501.cli import warm_up
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("Server mode needs Unix domain sockets")
+    socket_path = socket_path or default_socket_path()
+    warm_up()
+    server = make_server(socket_path)
+    print(f"Serving on {socket_path} (stop with: python -m dat5501 stop)", flush=True)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
@@ -0,0 +1,214 @@
+import os
+import socket
+import stat
+import threading
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")  # ensure no GUI needed for any plotting code
+
+import pytest
+
+from dat5501.cli import main, run
+import dat5501.server as server_module
+from dat5501.server import default_socket_path, forward, make_server, stop_server
+
+# ---------- Fixtures ----------
+
+@pytest.fixture
+def dates_csv(tmp_path: Path) -> Path:
+    p = tmp_path / "dates.csv"
+    p.write_text("date\n2020-01-01\n2021-06-15\n", encoding="utf-8")
+    return p
+
+
+@pytest.fixture
+def server(tmp_path: Path):
+    """A warm server on a temporary socket, running in a background thread."""
+    socket_path = str(tmp_path / "s.sock")
+    srv = make_server(socket_path)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    stop_server(socket_path)
+    thread.join(timeout=5)
+    srv.server_close()
+
+# ---------- Local commands ----------
+
+def test_calendar_command(capsys):
+    assert run(["calendar", "7", "0"]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == "Sun Mon Tue Wed Thu Fri Sat"
+    assert out[1].split() == ["1", "2", "3", "4", "5", "6", "7"]
+
+
+def test_duration_command_error_exit_code(capsys):
+    assert run(["duration", "20/10/2025"]) == 1
+    assert "Invalid date format" in capsys.readouterr().err
+
+
+def test_duration_csv_command(capsys, dates_csv: Path):
+    assert run(["duration-csv", str(dates_csv)]) == 0
+    out = capsys.readouterr().out
+    assert "days_ago" in out and "2021-06-15" in out
+
+
+def test_duration_csv_business_days(capsys, dates_csv: Path, tmp_path: Path):
+    holidays = tmp_path / "holidays.csv"
+    holidays.write_text("date\n2021-06-16\n", encoding="utf-8")
+    assert run(["duration-csv", str(dates_csv), "--business", "--holidays", str(holidays)]) == 0
+    assert "business_days_ago" in capsys.readouterr().out
+    assert run(["duration-csv", str(dates_csv), "--business", "--holidays", str(tmp_path / "no.csv")]) == 1
+
+
+def test_month_command_marks_holidays(capsys, tmp_path: Path):
+    holidays = tmp_path / "holidays.csv"
+    holidays.write_text("date\n2025-12-25\n", encoding="utf-8")
+    assert run(["month", "2025", "12", "--holidays", str(holidays)]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert out[1] == "      1   2   3   4   5   6*"
+    assert "25*" in out[4] and "24 " in out[4]
+
+
+def test_model_comparison_command(capsys, tmp_path: Path):
+    csv = tmp_path / "em.csv"
+    rows = "".join(f"Aland,ALD,{y},{1 + 0.01 * (y - 1950)}\n" for y in range(1950, 2021))
+    csv.write_text("Entity,Code,Year,Annual CO₂ emissions (per capita)\n" + rows, encoding="utf-8")
+    assert run(["model-comparison", "--csv", str(csv), "--entity", "Aland"]) == 0
+    out = capsys.readouterr().out
+    assert "chi2_dof" in out and out.count("Aland") == 9
+    assert run(["model-comparison", "--csv", str(csv), "--entity", "Nowhere"]) == 1
+
+
+def test_unknown_command_is_usage_error(capsys):
+    assert run(["nope"]) == 2
+
+
+def test_main_runs_locally_without_server(capsys, tmp_path: Path):
+    assert main(["--socket", str(tmp_path / "none.sock"), "calendar", "1", "6"]) == 0
+    assert capsys.readouterr().out.startswith("Sun Mon")
+
+# ---------- Server mode ----------
+
+def test_forward_without_server_returns_none(tmp_path: Path):
+    assert forward(str(tmp_path / "none.sock"), ["calendar", "1", "0"]) is None
+
+
+def test_server_round_trip(server, dates_csv: Path):
+    reply = forward(server, ["calendar", "7", "0"])
+    assert reply["exit_code"] == 0
+    assert reply["stdout"].startswith("Sun Mon Tue Wed Thu Fri Sat\n")
+
+    reply = forward(server, ["duration-csv", str(dates_csv)])
+    assert reply["exit_code"] == 0 and "2020-01-01" in reply["stdout"]
+
+    # Errors come back as an exit code; the server keeps running
+    reply = forward(server, ["duration", "bad"])
+    assert reply["exit_code"] == 1 and "Invalid date format" in reply["stderr"]
+    assert forward(server, ["calendar", "1", "0"])["exit_code"] == 0
+
+
+def test_main_uses_server_when_running(server, capsys):
+    assert main(["--socket", server, "calendar", "3", "0"]) == 0
+    assert capsys.readouterr().out.splitlines()[1].split() == ["1", "2", "3"]
+
+
+def test_second_server_on_live_socket_is_refused(server):
+    with pytest.raises(RuntimeError):
+        make_server(server)
+
+# ---------- Socket safety ----------
+
+def test_default_socket_prefers_xdg_runtime_dir(monkeypatch, tmp_path: Path):
+    monkeypatch.delenv("DAT5501_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert default_socket_path() == str(tmp_path / "dat5501.sock")
+    monkeypatch.setenv("DAT5501_SOCKET", "/somewhere/else.sock")
+    assert default_socket_path() == "/somewhere/else.sock"
+
+
+def test_socket_is_private(server):
+    assert stat.S_IMODE(os.stat(server).st_mode) == 0o600
+
+
+def test_socket_owned_by_another_user_is_ignored(server, monkeypatch):
+    monkeypatch.setattr(server_module.os, "getuid", lambda: os.geteuid() + 1)
+    assert forward(server, ["calendar", "1", "0"]) is None
+    with pytest.raises(RuntimeError):
+        make_server(server)
+
+
+def test_wedged_server_falls_back_to_local(tmp_path: Path, capsys):
+    socket_path = str(tmp_path / "wedged.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as wedged:
+        wedged.bind(socket_path)
+        wedged.listen(1)  # accepts connections but never replies
+        assert forward(socket_path, ["calendar", "1", "0"], timeout=0.2) is None
+        assert main(["--socket", socket_path, "--timeout", "0.2", "calendar", "1", "0"]) == 0
+    assert capsys.readouterr().out.startswith("Sun Mon")
+
+
+def test_accepted_command_without_reply_is_an_error(tmp_path: Path, capsys):
+    socket_path = str(tmp_path / "slow.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as slow:
+        slow.bind(socket_path)
+        slow.listen(1)
+
+        def accept_but_never_reply():
+            conn, _ = slow.accept()
+            with conn:
+                conn.makefile("rb").readline()
+                conn.sendall(b'{"accepted": true}\n')
+                conn.recv(1)  # hold the connection until the client gives up
+
+        thread = threading.Thread(target=accept_but_never_reply, daemon=True)
+        thread.start()
+        code = main(["--socket", socket_path, "--reply-timeout", "0.2", "calendar", "1", "0"])
+        thread.join(timeout=5)
+    captured = capsys.readouterr()
+    assert code == 1 and captured.out == ""  # not run a second time locally
+    assert "did not reply within 0.2 s" in captured.err
+
+
+def test_request_abandoned_while_busy_is_not_run(tmp_path: Path, monkeypatch):
+    socket_path = str(tmp_path / "s.sock")
+    srv = make_server(socket_path)
+    calls = []
+    monkeypatch.setattr(server_module, "execute", lambda *a, **k: calls.append(a))
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(b'{"argv": ["calendar", "1", "0"]}\n')
+        srv.handle_request()  # the client timed out and left before the server got to it
+    finally:
+        srv.server_close()
+    assert calls == []
+
+
+def test_idle_client_does_not_block_the_server(server, monkeypatch):
+    monkeypatch.setattr(server_module._Handler, "timeout", 0.2)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle:
+        idle.connect(server)  # connects but never sends a request
+        reply = forward(server, ["calendar", "1", "0"], timeout=5)
+    assert reply is not None and reply["exit_code"] == 0
+
+
+def test_client_settings_apply_on_the_server(server, monkeypatch, tmp_path: Path):
+    from dat5501.result_cache import default_cache
+
+    csv = tmp_path / "env_dates.csv"
+    csv.write_text("date\n2019-03-04\n", encoding="utf-8")
+    cache_dir = tmp_path / "client_cache"
+    monkeypatch.setenv("DAT5501_INSTRUMENT", "1")
+    monkeypatch.setenv("DAT5501_CACHE_DIR", str(cache_dir))
+    previous = default_cache.cache_dir
+
+    reply = forward(server, ["duration-csv", str(csv)])
+    assert reply["exit_code"] == 0
+    assert "duration_from_csv.days_from_csv" in reply["stderr"]  # summary for this command only
+    assert list(cache_dir.glob("*.pkl"))
+    assert default_cache.cache_dir == previous  # the server's own setting is restored
+
+    monkeypatch.delenv("DAT5501_INSTRUMENT")
+    assert "rows/s" not in forward(server, ["calendar", "1", "0"])["stderr"]
@@ -0,0 +1,117 @@
+import json
+
+import numpy as np
+import pytest
+
+import dat5501.instrumentation as inst
+from dat5501.instrumentation import instrumentation, instrumented, rows_in, rows_out, stage
+
+
+@instrumented("tests.double", rows=rows_in)
+def _double(values):
+    return [v * 2 for v in values]
+
+
+@instrumented("tests.make", rows=rows_out)
+def _make(n):
+    return np.ones(n)
+
+
+def test_disabled_by_default_records_nothing():
+    assert not inst.enabled()
+    with stage("tests.noop") as st:
+        st.rows = 5  # harmless on the null stage
+    assert _double([1, 2]) == [2, 4]
+
+
+def test_context_manager_records_stage_metrics():
+    with instrumentation() as rec:
+        with stage("tests.block", rows=1_000):
+            sum(range(1_000))
+        _double([1, 2, 3])
+        _make(10)
+    assert not inst.enabled()  # switched off again after the block
+
+    assert [r["stage"] for r in rec.records] == ["tests.block", "tests.double", "tests.make"]
+    block, double, make = rec.records
+    assert block["rows"] == 1_000 and block["seconds"] > 0
+    assert block["rows_per_sec"] == pytest.approx(1_000 / block["seconds"])
+    assert double["rows"] == 3
+    assert make["rows"] == 10
+
+
+def test_peak_allocation_and_nesting():
+    with instrumentation() as rec:
+        with stage("tests.outer"):
+            with stage("tests.inner"):
+                big = np.ones(1_000_000)  # ~8 MB
+                del big
+            small = np.ones(10)
+    inner = next(r for r in rec.records if r["stage"] == "tests.inner")
+    outer = next(r for r in rec.records if r["stage"] == "tests.outer")
+    # The outer stage must still see the inner stage's peak
+    assert outer["peak_bytes"] >= 8_000_000
+    if inst._HAS_RESET_PEAK:  # nested peaks are None on Python 3.8
+        assert outer["peak_bytes"] >= inner["peak_bytes"] >= 8_000_000
+
+
+@pytest.mark.parametrize("has_reset_peak", [True, False])
+def test_sequential_stages_have_their_own_peak(monkeypatch, has_reset_peak):
+    # False simulates Python 3.8, which has no tracemalloc.reset_peak
+    if has_reset_peak and not inst._HAS_RESET_PEAK:
+        pytest.skip("tracemalloc.reset_peak needs Python 3.9+")
+    monkeypatch.setattr(inst, "_HAS_RESET_PEAK", has_reset_peak)
+    with instrumentation() as rec:
+        with stage("tests.big"):
+            big = np.ones(5_000_000)  # ~40 MB
+            del big
+        with stage("tests.small"):
+            small = np.ones(10)
+    big_rec, small_rec = rec.records
+    assert big_rec["peak_bytes"] >= 40_000_000
+    assert small_rec["peak_bytes"] < 1_000_000
+
+
+def test_nested_peak_unknown_without_reset_peak(monkeypatch):
+    monkeypatch.setattr(inst, "_HAS_RESET_PEAK", False)
+    with instrumentation() as rec:
+        with stage("tests.outer"):
+            with stage("tests.inner"):
+                big = np.ones(1_000_000)
+                del big
+    inner, outer = rec.records
+    assert inner["peak_bytes"] is None  # would otherwise include the outer stage's peak
+    assert outer["peak_bytes"] >= 8_000_000
+
+
+def test_rows_set_after_the_fact():
+    with instrumentation(trace_memory=False) as rec:
+        with stage("tests.late") as st:
+            st.rows = 42
+    assert rec.records[0]["rows"] == 42
+    assert rec.records[0]["peak_bytes"] is None
+
+
+def test_jsonl_and_prometheus_export(tmp_path):
+    with instrumentation(trace_memory=False) as rec:
+        _double([1, 2])
+        _double([1, 2, 3])
+
+    path = tmp_path / "stages.jsonl"
+    rec.write_jsonl(path)
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["rows"] for r in lines] == [2, 3]
+
+    prom = rec.to_prometheus()
+    assert "# TYPE dat5501_stage_calls_total counter" in prom
+    assert 'dat5501_stage_calls_total{stage="tests.double"} 2' in prom
+    assert 'dat5501_stage_rows_total{stage="tests.double"} 5' in prom
+
+
+def test_configure_from_env(monkeypatch):
+    monkeypatch.setattr(inst, "_ACTIVE", None)
+    monkeypatch.setattr(inst.atexit, "register", lambda *a, **k: None)
+    assert inst.configure_from_env({}) is None
+    assert inst.configure_from_env({inst.ENV_VAR: "0"}) is None
+    rec = inst.configure_from_env({inst.ENV_VAR: "out.prom"})
+    assert rec is not None and inst.enabled()
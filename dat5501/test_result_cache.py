@@ -0,0 +1,174 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import dat5501.result_cache as result_cache
+from dat5501.result_cache import ResultCache, cached, make_key
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame({"state": ["A", "A", "B"], "votes": [1, 2, 3]})
+
+
+def test_key_depends_on_contents_not_identity(df):
+    assert make_key("f", (df,)) == make_key("f", (df.copy(),))
+    changed = df.copy()
+    changed.loc[0, "votes"] = 99
+    assert make_key("f", (df,)) != make_key("f", (changed,))
+    renamed = df.rename(columns={"votes": "v"})
+    assert make_key("f", (df,)) != make_key("f", (renamed,))
+    assert make_key("f", (df, "x")) != make_key("f", (df, "y"))
+    assert make_key("f", (df,)) != make_key("g", (df,))
+
+
+def test_key_covers_each_column_dtype():
+    base = pd.DataFrame({
+        "cat": pd.Categorical(["a", "b", "a"]),
+        "when": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03"]),
+        "text": ["x", "y", "z"],
+        "flag": [True, False, True],
+    })
+    edits = [
+        base.assign(cat=pd.Categorical(["a", "b", "b"])),
+        base.assign(cat=pd.Categorical(["a", "c", "a"])),  # same codes, other categories
+        base.assign(when=base["when"] + pd.Timedelta(days=1)),
+        base.assign(text=["x", "y", "w"]),
+        base.assign(flag=[True, True, True]),
+        base.set_axis([10, 11, 12]),
+    ]
+    keys = {make_key("f", (frame,)) for frame in edits}
+    assert make_key("f", (base.copy(),)) == make_key("f", (base,))
+    assert len(keys | {make_key("f", (base,))}) == len(edits) + 1
+
+
+def test_columns_restrict_the_key_to_what_is_read(df):
+    cache = ResultCache()
+    calls = []
+
+    @cached(cache, columns=["votes"])
+    def total(frame):
+        calls.append(1)
+        return frame["votes"].sum()
+
+    assert total(df) == 6
+    # Unread columns and the index don't matter...
+    assert total(df.assign(state=["X", "Y", "Z"]).set_axis([7, 8, 9])) == 6
+    assert len(calls) == 1
+    # ...but the read column does
+    assert total(df.assign(votes=[1, 2, 4])) == 7
+    assert len(calls) == 2
+
+
+def test_key_hashes_file_contents(tmp_path: Path):
+    a, b = tmp_path / "a.csv", tmp_path / "b.csv"
+    a.write_text("date\n2020-01-01\n")
+    b.write_text("date\n2020-01-01\n")
+    assert make_key("f", (a,)) == make_key("f", (b,))
+    b.write_text("date\n2021-01-01\n")
+    assert make_key("f", (a,)) != make_key("f", (b,))
+
+
+def test_cached_function_hits_and_misses(df):
+    cache = ResultCache()
+    calls = []
+
+    @cached(cache)
+    def total(frame, column):
+        calls.append(column)
+        return frame[column].sum()
+
+    assert total(df, "votes") == 6
+    assert total(df.copy(), "votes") == 6
+    assert calls == ["votes"]
+    assert cache.stats["memory_hits"] == 1 and cache.stats["misses"] == 1
+    assert cache.hit_rate() == pytest.approx(0.5)
+
+
+def test_cached_results_are_copies(df):
+    cache = ResultCache()
+
+    @cached(cache)
+    def double(frame):
+        return frame.assign(votes=frame["votes"] * 2)
+
+    first = double(df)
+    first.loc[0, "votes"] = -1  # caller mutates its result
+    assert double(df).loc[0, "votes"] == 2
+
+
+def test_lru_eviction_by_size():
+    cache = ResultCache(max_bytes=2_500)
+    for i in range(3):
+        cache.put(f"k{i}", np.zeros(100))  # 800 bytes each
+    cache.get("k0")                         # k0 becomes most recent
+    cache.put("k3", np.zeros(100))          # evicts k1, the least recent
+    assert cache.get("k1")[0] is False
+    assert cache.get("k0")[0] and cache.get("k2")[0] and cache.get("k3")[0]
+    assert cache.stats["evictions"] == 1
+
+
+def test_disk_tier_survives_new_process_cache(tmp_path: Path, df):
+    ResultCache(cache_dir=tmp_path).put("f-abc", df)
+    fresh = ResultCache(cache_dir=tmp_path)
+    hit, value = fresh.get("f-abc")
+    assert hit and fresh.stats["disk_hits"] == 1
+    pd.testing.assert_frame_equal(value, df)
+
+
+def test_unloadable_disk_entry_is_a_miss(tmp_path: Path):
+    # e.g. pickled under another pandas version: loading raises ModuleNotFoundError
+    (tmp_path / "f-abc.pkl").write_bytes(b"cno_such_mod\nFoo\n.")
+    cache = ResultCache(cache_dir=tmp_path)
+    assert cache.get("f-abc") == (False, None)
+    assert not (tmp_path / "f-abc.pkl").exists()
+    assert cache.stats["misses"] == 1
+
+
+def test_key_function_hashes_a_file_once(tmp_path: Path, monkeypatch):
+    csv = tmp_path / "a.csv"
+    csv.write_text("date\n2020-01-01\n")
+    opened = []
+    monkeypatch.setattr(result_cache, "open", lambda p, mode: opened.append(p) or open(p, mode),
+                        raising=False)
+    cache = ResultCache()
+    calls = []
+
+    @cached(cache, key=lambda path: Path(path))
+    def size(path):
+        calls.append(path)
+        return Path(path).stat().st_size
+
+    size(csv)
+    size(str(csv))  # same file as a string: a hit
+    assert len(calls) == 1
+    assert opened == [csv, csv]  # one read per call
+
+
+def test_disk_tier_is_size_bounded(tmp_path: Path):
+    cache = ResultCache(cache_dir=tmp_path, max_disk_bytes=3_000)
+    for i in range(5):
+        cache.put(f"k{i}", np.zeros(100))
+    assert sum(p.stat().st_size for p in tmp_path.glob("*.pkl")) <= 3_000
+
+
+def test_invalidation(tmp_path: Path, df):
+    cache = ResultCache(cache_dir=tmp_path)
+    calls = []
+
+    @cached(cache, key_extra=lambda frame: "v1")
+    def rows(frame):
+        calls.append(1)
+        return len(frame)
+
+    rows(df)
+    cache.put("other-key", 1)
+    assert rows.cache_clear() == 2  # memory + disk copy of rows' entry
+    rows(df)
+    assert len(calls) == 2
+    assert cache.get("other-key")[0]
+    cache.invalidate()
+    assert cache.get("other-key")[0] is False
+    assert not list(tmp_path.glob("*.pkl"))
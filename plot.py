@@ -1,44 +1,107 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-np.random.seed(123)
-
-# Choose the "true" parameters.
-m_true = -0.9594
-b_true = 4.294
-f_true = 0.534
-
-# Generate some synthetic data from the model.
-N = 50
-x = np.sort(10 * np.random.rand(N))
-yerr = 0.1 + 0.5 * np.random.rand(N)
-#xerr = 0.1 + 0.5 * np.random.rand(N)
-y = m_true * x + b_true
-y += np.abs(f_true * y) * np.random.randn(N)
-y += yerr * np.random.randn(N)
-
-plt.errorbar(x, y, yerr=yerr, fmt=".k", capsize=0)
-x0 = np.linspace(0, 10, 500)
-plt.plot(x0, m_true * x0 + b_true, "k", alpha=0.3, lw=3)
-plt.xlim(0, 10)
-plt.xlabel("x")
-plt.ylabel("y")
-
-A = np.vander(x, 2)
-C = np.diag(yerr * yerr)
-ATA = np.dot(A.T, A / (yerr**2)[:, None])
-cov = np.linalg.inv(ATA)
-w = np.linalg.solve(ATA, np.dot(A.T, y / yerr**2))
-print("Least-squares estimates:")
-print("m = {0:.3f} ± {1:.3f}".format(w[0], np.sqrt(cov[0, 0])))
-print("b = {0:.3f} ± {1:.3f}".format(w[1], np.sqrt(cov[1, 1])))
-
-plt.errorbar(x, y, yerr=yerr, fmt=".k", capsize=0)
-plt.plot(x0, m_true * x0 + b_true, "k", alpha=0.3, lw=3, label="truth")
-plt.plot(x0, np.dot(np.vander(x0, 2), w), "--k", label="LS")
-plt.legend(fontsize=14)
-plt.xlim(0, 10)
-plt.xlabel("x")
-plt.ylabel("y")
-
-plt.show()
\ No newline at end of file
+
+def _solve_triangular(T, b, lower):
+    """
+    Solve T x = b by forward (lower) or back (upper) substitution, batched
+    over leading axes. T is (..., k, k) and b is (..., k); k is degree + 1,
+    so the loop is over a handful of columns.
+    """
+    k = T.shape[-1]
+    x = np.zeros(np.broadcast_shapes(T.shape[:-2], b.shape[:-1]) + (k,))
+    for i in (range(k) if lower else reversed(range(k))):
+        # Unsolved entries of x are still zero, so the full dot only picks up solved ones
+        x[..., i] = (b[..., i] - np.einsum("...j,...j->...", T[..., i, :], x)) / T[..., i, i]
+    return x
+
+
+def weighted_linear_fit(x, y, yerr, degree=1, return_cov=True):
+    """
+    Weighted least-squares polynomial fit of y against x (highest power first,
+    like np.vander / np.polyfit).
+
+    y can be one dataset (N,) or a batch (B, N) sharing the same x; yerr can be
+    shared (N,) or per dataset (B, N). A straight line uses a Cholesky factor
+    of the 2 x 2 weighted normal equations; higher degrees use a QR
+    factorisation of the weighted Vandermonde matrix, which avoids squaring
+    its condition number. Either way the solution comes from triangular solves.
+
+    Returns (w, cov) with shapes (k,) / (B, k) and (k, k) / (B, k, k), k = degree + 1;
+    cov is None when return_cov is False.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    sqrt_ivar = 1.0 / np.asarray(yerr, dtype=float)
+    A = np.vander(x, degree + 1)
+
+    # Both branches give an upper-triangular U with A^T W A = U^T U and U w = c
+    if degree <= 1:
+        ivar = sqrt_ivar**2
+        if ivar.ndim == 1:
+            ATA = A.T @ (A * ivar[:, None])
+        else:
+            ATA = np.einsum("nk,bn,nj->bkj", A, ivar, A, optimize=True)
+        L = np.linalg.cholesky(ATA)
+        U = np.swapaxes(L, -1, -2)
+        c = _solve_triangular(L, (y * ivar) @ A, lower=True)
+    else:
+        if sqrt_ivar.ndim == 1:
+            Q, U = np.linalg.qr(A * sqrt_ivar[:, None])
+            c = (y * sqrt_ivar) @ Q
+        else:
+            Q, U = np.linalg.qr(A * sqrt_ivar[..., None])
+            c = np.einsum("bnk,bn->bk", Q, y * sqrt_ivar)
+    w = _solve_triangular(U, c, lower=False)
+    if not return_cov:
+        return w, None
+
+    # cov = (U^T U)^-1 = U^-1 U^-T; row j of the batched solve is U^-1 e_j
+    eye = np.eye(degree + 1)
+    U_inv = np.swapaxes(_solve_triangular(U[..., None, :, :], eye, lower=False), -1, -2)
+    cov = U_inv @ np.swapaxes(U_inv, -1, -2)
+    return w, cov
+
+
+def main():
+    np.random.seed(123)
+
+    # Choose the "true" parameters.
+    m_true = -0.9594
+    b_true = 4.294
+    f_true = 0.534
+
+    # Generate some synthetic data from the model.
+    N = 50
+    x = np.sort(10 * np.random.rand(N))
+    yerr = 0.1 + 0.5 * np.random.rand(N)
+    #xerr = 0.1 + 0.5 * np.random.rand(N)
+    y = m_true * x + b_true
+    y += np.abs(f_true * y) * np.random.randn(N)
+    y += yerr * np.random.randn(N)
+
+    plt.errorbar(x, y, yerr=yerr, fmt=".k", capsize=0)
+    x0 = np.linspace(0, 10, 500)
+    plt.plot(x0, m_true * x0 + b_true, "k", alpha=0.3, lw=3)
+    plt.xlim(0, 10)
+    plt.xlabel("x")
+    plt.ylabel("y")
+
+    w, cov = weighted_linear_fit(x, y, yerr)
+    print("Least-squares estimates:")
+    print("m = {0:.3f} ± {1:.3f}".format(w[0], np.sqrt(cov[0, 0])))
+    print("b = {0:.3f} ± {1:.3f}".format(w[1], np.sqrt(cov[1, 1])))
+
+    plt.errorbar(x, y, yerr=yerr, fmt=".k", capsize=0)
+    plt.plot(x0, m_true * x0 + b_true, "k", alpha=0.3, lw=3, label="truth")
+    plt.plot(x0, np.dot(np.vander(x0, 2), w), "--k", label="LS")
+    plt.legend(fontsize=14)
+    plt.xlim(0, 10)
+    plt.xlabel("x")
+    plt.ylabel("y")
+
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
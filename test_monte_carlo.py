@@ -0,0 +1,45 @@
+import matplotlib
+matplotlib.use("Agg")  # plot.py imports pyplot
+
+import numpy as np
+import pytest
+
+from monte_carlo import generate_datasets, recovery_summary, simulate_fits
+from plot import weighted_linear_fit
+
+
+def test_generate_datasets_shapes():
+    rng = np.random.default_rng(0)
+    x, y, yerr = generate_datasets(rng, 7, n_points=20)
+    assert x.shape == (20,) and yerr.shape == (20,)
+    assert y.shape == (7, 20)
+    assert np.all(np.diff(x) >= 0)
+
+
+def test_batched_fit_matches_single_fits():
+    rng = np.random.default_rng(1)
+    x, y, yerr = generate_datasets(rng, 5)
+    w, _ = weighted_linear_fit(x, y, yerr)
+    for i in range(5):
+        np.testing.assert_allclose(w[i], weighted_linear_fit(x, y[i], yerr)[0])
+
+
+def test_honest_errors_are_unbiased_with_nominal_coverage():
+    """With f=0 the reported errors are correct: ~68% coverage at 1 sigma."""
+    w, sigma = simulate_fits(20_000, f=0.0, seed=7, chunk_size=5_000)
+    summary = recovery_summary(w, sigma)
+    assert summary["bias"].abs().max() < 0.01
+    assert summary["coverage"].to_numpy() == pytest.approx([0.683, 0.683], abs=0.02)
+
+
+def test_underestimated_errors_undercover():
+    w, sigma = simulate_fits(5_000, seed=7, chunk_size=1_000)
+    assert (recovery_summary(w, sigma)["coverage"] < 0.5).all()
+
+
+def test_results_do_not_depend_on_worker_count():
+    w1, s1 = simulate_fits(2_500, seed=3, chunk_size=1_000, n_workers=1)
+    w2, s2 = simulate_fits(2_500, seed=3, chunk_size=1_000, n_workers=2)
+    assert w1.shape == (2_500, 2)
+    np.testing.assert_array_equal(w1, w2)
+    np.testing.assert_array_equal(s1, s2)
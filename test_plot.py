@@ -0,0 +1,92 @@
+import matplotlib
+matplotlib.use("Agg")  # ensure no GUI needed for any plotting code
+
+import numpy as np
+import pytest
+
+from plot import weighted_linear_fit
+
+
+def _dense_reference(x, y, yerr, degree):
+    """Original plot.py approach: inverse plus solve of the weighted normal equations."""
+    A = np.vander(x, degree + 1)
+    ATA = np.dot(A.T, A / (yerr**2)[:, None])
+    cov = np.linalg.inv(ATA)
+    w = np.linalg.solve(ATA, np.dot(A.T, y / yerr**2))
+    return w, cov
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(123)
+    x = np.sort(10 * rng.random(50))
+    yerr = 0.1 + 0.5 * rng.random(50)
+    y = -0.9594 * x + 4.294 + yerr * rng.standard_normal(50)
+    return x, y, yerr
+
+
+def test_matches_original_normal_equations(data):
+    x, y, yerr = data
+    w, cov = weighted_linear_fit(x, y, yerr)
+    w_ref, cov_ref = _dense_reference(x, y, yerr, 1)
+    np.testing.assert_allclose(w, w_ref, rtol=1e-10)
+    np.testing.assert_allclose(cov, cov_ref, rtol=1e-10)
+
+
+def test_higher_degree_recovers_exact_polynomial(data):
+    x, _, yerr = data
+    y = 0.5 * x**2 - 2.0 * x + 1.0
+    w, cov = weighted_linear_fit(x, y, yerr, degree=2)
+    np.testing.assert_allclose(w, [0.5, -2.0, 1.0], atol=1e-9)
+    assert cov.shape == (3, 3)
+
+
+def test_batch_with_shared_errors(data):
+    x, y, yerr = data
+    ys = np.stack([y, 2 * y, y + 1])
+    w, cov = weighted_linear_fit(x, ys, yerr)
+    assert w.shape == (3, 2) and cov.shape == (2, 2)
+    for row, yi in zip(w, ys):
+        np.testing.assert_allclose(row, _dense_reference(x, yi, yerr, 1)[0], rtol=1e-10)
+
+
+def test_batch_with_per_dataset_errors(data):
+    x, y, yerr = data
+    ys = np.stack([y, y])
+    errs = np.stack([yerr, 2 * yerr[::-1]])
+    w, cov = weighted_linear_fit(x, ys, errs)
+    assert w.shape == (2, 2) and cov.shape == (2, 2, 2)
+    for i in range(2):
+        w_ref, cov_ref = _dense_reference(x, ys[i], errs[i], 1)
+        np.testing.assert_allclose(w[i], w_ref, rtol=1e-10)
+        np.testing.assert_allclose(cov[i], cov_ref, rtol=1e-10)
+
+
+def test_higher_degree_uses_qr_on_ill_conditioned_x():
+    # Raw calendar years: the normal equations would square an already huge condition number
+    rng = np.random.default_rng(0)
+    x = np.arange(1950.0, 2021.0)
+    yerr = 0.1 + rng.random(x.size)
+    y = 1e-4 * (x - 1985) ** 3 - 0.02 * (x - 1985) ** 2 + 3.0 + yerr * rng.standard_normal(x.size)
+    w, _ = weighted_linear_fit(x, y, yerr, degree=3)
+    w_ref = np.polyfit(x, y, 3, w=1 / yerr)  # SVD-based lstsq
+    np.testing.assert_allclose(np.polyval(w, x), np.polyval(w_ref, x), rtol=1e-6)
+
+
+def test_higher_degree_batch_matches_single_fits(data):
+    x, y, yerr = data
+    ys = np.stack([y, y**2 / 10])
+    errs = np.stack([yerr, yerr[::-1]])
+    w, cov = weighted_linear_fit(x, ys, errs, degree=2)
+    assert w.shape == (2, 3) and cov.shape == (2, 3, 3)
+    for i in range(2):
+        w_ref, cov_ref = _dense_reference(x, ys[i], errs[i], 2)
+        np.testing.assert_allclose(w[i], w_ref, rtol=1e-8)
+        np.testing.assert_allclose(cov[i], cov_ref, rtol=1e-8)
+
+
+def test_covariance_is_optional(data):
+    x, y, yerr = data
+    w, cov = weighted_linear_fit(x, y, yerr, return_cov=False)
+    assert cov is None
+    np.testing.assert_allclose(w, weighted_linear_fit(x, y, yerr)[0])